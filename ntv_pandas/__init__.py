@@ -19,6 +19,31 @@ This package contains the following classes and functions:
     - `ntv-pandas.ntv_pandas.pandas_ntv_connector.as_def_type`
     - `ntv-pandas.ntv_pandas.pandas_ntv_connector.equals`
 
+- `ntv-pandas.ntv_pandas.pandas_ntv_stream` :
+
+    - `ntv-pandas.ntv_pandas.pandas_ntv_stream.read_json_file`
+    - `ntv-pandas.ntv_pandas.pandas_ntv_stream.to_json_file`
+    - `ntv-pandas.ntv_pandas.pandas_ntv_stream.JsonStream`
+
+- `ntv-pandas.ntv_pandas.pandas_ntv_json` :
+
+    - `ntv-pandas.ntv_pandas.pandas_ntv_json.set_json_backend`
+    - `ntv-pandas.ntv_pandas.pandas_ntv_json.get_json_backend`
+
+- `ntv-pandas.ntv_pandas.pandas_ntv_codec` :
+
+    - `ntv-pandas.ntv_pandas.pandas_ntv_codec.codec_cache_info`
+    - `ntv-pandas.ntv_pandas.pandas_ntv_codec.codec_cache_clear`
+    - `ntv-pandas.ntv_pandas.pandas_ntv_codec.set_codec_cache`
+
+- `ntv-pandas.ntv_pandas.pandas_ntv_analysis` :
+
+    - `ntv-pandas.ntv_pandas.pandas_ntv_analysis.PdAnalysis`
+
+- `ntv-pandas.ntv_pandas.pandas_ntv_lazy` :
+
+    - `ntv-pandas.ntv_pandas.pandas_ntv_lazy.LazyFrame`
+
 - `ntv-pandas.ntv_pandas.accessors` :
 
     - `ntv-pandas.ntv_pandas.accessors.NpdSeriesAccessor`
@@ -28,16 +53,31 @@ This package contains the following classes and functions:
 from ntv_pandas.pandas_ntv_connector import DataFrameConnec, SeriesConnec, read_json
 from ntv_pandas.pandas_ntv_connector import to_json, as_def_type, equals, to_analysis
 from ntv_pandas.pandas_ntv_connector import from_xarray, from_scipp
+from ntv_pandas.pandas_ntv_stream import read_json_file, to_json_file
+from ntv_pandas.pandas_ntv_json import set_json_backend, get_json_backend
+from ntv_pandas.pandas_ntv_codec import codec_cache_info, codec_cache_clear
+from ntv_pandas.pandas_ntv_codec import set_codec_cache
+from ntv_pandas.pandas_ntv_analysis import PdAnalysis
+from ntv_pandas.pandas_ntv_lazy import LazyFrame
 import ntv_pandas.pandas_accessors as pandas_accessors
 
 __all__ = [
     "DataFrameConnec",
     "SeriesConnec",
     "read_json",
+    "read_json_file",
     "to_json",
+    "to_json_file",
     "as_def_type",
     "equals",
     "to_analysis",
+    "PdAnalysis",
+    "LazyFrame",
+    "set_json_backend",
+    "get_json_backend",
+    "codec_cache_info",
+    "codec_cache_clear",
+    "set_codec_cache",
     "from_xarray",
     "from_scipp",
     "pandas_accessors",
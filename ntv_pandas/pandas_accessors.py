@@ -12,7 +12,9 @@ import pandas as pd
 from tab_analysis import AnaDataset
 from ntv_numpy import Xdataset
 from ntv_pandas.pandas_ntv_connector import to_json, as_def_type, equals
-from ntv_pandas.pandas_ntv_connector import to_analysis, check_relation
+from ntv_pandas.pandas_ntv_connector import to_analysis, check_relation, check_relations
+from ntv_pandas.pandas_ntv_stream import to_json_file
+from ntv_pandas.pandas_ntv_analysis import PdAnalysis
 
 try:
     # delete the accessor to avoid warning
@@ -27,17 +29,42 @@ class NpdDataFrameAccessor:
 
     def __init__(self, pandas_obj):
         self._obj = pandas_obj
+        self._analysis = None
 
-    def analysis(self, distr=False):
+    def analysis(self, distr=False, workers=None, approx=False):
         """Accessor for method `tab_analysis.AnaDataset` applied with
-        `pandas_ntv_connector.to_analysis` invoked as `pd.DataFrame.npd.analysis`"""
-        return AnaDataset(to_analysis(self._obj, distr))
+        `pandas_ntv_analysis.PdAnalysis.to_analysis` invoked as
+        `pd.DataFrame.npd.analysis`.
+
+        The PdAnalysis object is kept by the accessor, only the relations of
+        the new or modified columns are computed at the next call.
+
+        *parameters*
+
+        - **distr** : boolean (default False) - if True the relations include
+        the distributed indicator
+        - **workers** : integer (default None) - if not None, number of processes
+        used to compute the relations
+        - **approx** : boolean (default False) - if True the relations with a high
+        cardinality column are estimated with `pandas_ntv_connector.to_analysis`
+        (the PdAnalysis object is not used)"""
+        if approx:
+            return AnaDataset(to_analysis(self._obj, distr, approx=True))
+        if self._analysis is None or self._analysis.distr != distr:
+            self._analysis = PdAnalysis(distr=distr)
+        self._analysis.workers = workers
+        return AnaDataset(self._analysis.update(self._obj).to_analysis())
 
     def check_relation(self, parent, child, typecoupl, value=True):
         """Accessor for method `pandas_ntv_connector.check_relation` invoket as
         `pd.DataFrame.npd.check_relation`"""
         return check_relation(self._obj, parent, child, typecoupl, value)
 
+    def check_relations(self, relations, value=True):
+        """Accessor for method `pandas_ntv_connector.check_relations` invoked as
+        `pd.DataFrame.npd.check_relations`"""
+        return check_relations(self._obj, relations, value)
+
     def to_json(self, **kwargs):
         """Accessor for method `pandas_ntv_connector.to_json` invoked as
         `pd.DataFrame.npd.to_json`
@@ -49,9 +76,32 @@ class NpdDataFrameAccessor:
         - **header** : boolean (default: True) - if True the JSON data is included as
         value in a {key:value} object where key is ':field' for Series or ':tab' for DataFrame
         - **table** : boolean (default False) - if True return TableSchema format
-        - **index** : boolean (default True) - if True the index Series is included"""
+        - **index** : boolean (default True) - if True the index Series is included
+        - **workers** : integer (default None) - if not None, number of workers used
+        to encode the columns concurrently (NTV tab format)
+        - **executor** : string (default 'thread') - pool of workers ('thread' or 'process')
+        - **optimize** : boolean (default False) - if True each column is encoded
+        with the smallest format (full, codec+keys or 'coef')
+        - **format** : string (default 'json') - 'json' or 'cbor' (binary format
+        with typed arrays for the numeric columns)"""
         return to_json(self._obj, **kwargs)
 
+    def to_json_file(self, path_or_buf, **kwargs):
+        """Accessor for method `pandas_ntv_stream.to_json_file` invoked as
+        `pd.DataFrame.npd.to_json_file`
+
+        *parameters*
+
+        - **path_or_buf** : string, Path or file object (text or binary) - file to write
+        - **header** : boolean (default: True) - if True the JSON data is included as
+        value in a {key:value} object where key is ':tab'
+        - **table** : boolean (default False) - if True write TableSchema format
+        - **index** : boolean (default True) - if True the index Series is included
+        - **chunksize** : integer (default 10000) - number of records in a TableSchema batch
+        - **optimize** : boolean (default False) - if True each column is encoded
+        with the smallest format (full, codec+keys or 'coef')"""
+        to_json_file(self._obj, path_or_buf, **kwargs)
+
     def as_def_type(self):
         """Accessor for method `pandas_ntv_connector.as_def_type` invoked as
         `pd.DataFrame.npd.as_def_type`"""
@@ -109,6 +159,11 @@ class NpdSeriesAccessor:
         `pd.Series.npd.to_json`"""
         return to_json(self._obj, **kwargs)
 
+    def to_json_file(self, path_or_buf, **kwargs):
+        """Accessor for method `pandas_ntv_stream.to_json_file` invoked as
+        `pd.Series.npd.to_json_file`"""
+        to_json_file(self._obj, path_or_buf, **kwargs)
+
     def as_def_type(self):
         """Accessor for method `pandas_ntv_connector.as_def_type` invoked as
         `pd.Series.npd.as_def_type`"""
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: philippe@loco-labs.io
+
+The `pandas_ntv_analysis` module is part of the `ntv-pandas.ntv_pandas` package
+([specification document](
+https://loco-philippe.github.io/ES/JSON%20semantic%20format%20(JSON-NTV).htm)).
+
+It contains the class `PdAnalysis` to keep the data used by the `tab_analysis`
+module up to date with a DataFrame (only the relations of the new or modified
+columns are computed).
+"""
+
+from functools import partial
+import numpy as np
+
+from json_ntv.ntv_util import NtvError
+from ntv_pandas.pandas_ntv_connector import PdUtil, SeriesConnec, _dist
+
+
+def _dist_pairs(task, distr=False):
+    """return the list of _dist of couples of columns.
+
+    The task is a tuple with the list of couples of names and the dict of keys."""
+    pairs, keys = task
+    return [_dist(keys[name1], keys[name2], distr) for name1, name2 in pairs]
+
+
+class PdAnalysis:
+    """Incremental analysis of the relations between the columns of a DataFrame.
+
+    The codes of each column and the relations between each couple of columns
+    are kept, only the relations of the new or modified columns are computed.
+
+    *Attributes :*
+
+    - **distr** : boolean - if True the relations include the distributed indicator
+    - **workers** : integer - if not None, number of processes used to compute
+    the relations
+    - **length** : integer - length of the columns
+    - **columns** : list - names of the columns
+    - **keys** : dict - codes (numpy array of pandas codes + 1) of each column
+    - **lencodec** : dict - number of distinct values of each column
+    - **relations** : dict - relation of each couple of columns (frozenset of names)
+    - **nb_computed** : integer - number of relations computed
+
+    The methods defined in this class are :
+
+    - `update`: synchronize the analysis with the columns of a DataFrame
+    - `set_column`: add or replace a column
+    - `drop_column`: remove a column
+    - `to_analysis`: return a dict with data used in AnaDataset module
+    - `codes` (static method): return the codes of a Series
+    """
+
+    def __init__(self, pd_df=None, distr=False, workers=None):
+        """PdAnalysis constructor.
+
+        *Parameters*
+
+        - **pd_df** : DataFrame (default None) - DataFrame to analyse
+        - **distr** : boolean (default False) - if True the relations include
+        the distributed indicator
+        - **workers** : integer (default None) - if not None, number of processes
+        used to compute the relations
+        """
+        self.distr = distr
+        self.workers = workers
+        self.length = None
+        self.columns = []
+        self.keys = {}
+        self.lencodec = {}
+        self.relations = {}
+        self.nb_computed = 0
+        if pd_df is not None:
+            self.update(pd_df)
+
+    @staticmethod
+    def codes(srs):
+        """return the codes (numpy array of pandas codes + 1) of a Series"""
+        return SeriesConnec.to_idx(srs, as_array=True)["keys"].astype("int64") + 1
+
+    def update(self, pd_df):
+        """synchronize the analysis with the columns of a DataFrame and return self
+        (the unchanged columns keep their relations)"""
+        if len(pd_df) != self.length:
+            self.columns, self.keys, self.lencodec, self.relations = [], {}, {}, {}
+            self.length = len(pd_df)
+        for name in set(self.columns) - set(pd_df.columns):
+            self._remove(name)
+        for name in pd_df.columns:
+            key = PdAnalysis.codes(pd_df[name])
+            if name not in self.keys or not np.array_equal(self.keys[name], key):
+                self._remove(name)
+                self._add(name, key)
+        self.columns = list(pd_df.columns)
+        self._compute()
+        return self
+
+    def set_column(self, name, srs):
+        """add (at the end) or replace a column and return self"""
+        key = PdAnalysis.codes(srs)
+        if self.length is None:
+            self.length = len(key)
+        elif len(key) != self.length:
+            raise NtvError("the length of the Series is not the length of the columns")
+        if name not in self.columns:
+            self.columns.append(name)
+        self._remove(name)
+        self._add(name, key)
+        self._compute()
+        return self
+
+    def drop_column(self, name):
+        """remove a column and return self"""
+        self.columns.remove(name)
+        self._remove(name)
+        return self
+
+    def to_analysis(self):
+        """return a dict with data used in AnaDataset module (same as
+        `pandas_ntv_connector.to_analysis`)"""
+        cols = self.columns
+        return {
+            "fields": [
+                {
+                    "lencodec": self.lencodec[col],
+                    "id": col,
+                    "mincodec": self.lencodec[col],
+                }
+                for col in cols
+            ],
+            "name": None,
+            "length": self.length or 0,
+            "relations": {
+                cols[i]: {
+                    cols[j]: self.relations[frozenset((cols[i], cols[j]))]
+                    for j in range(i + 1, len(cols))
+                }
+                for i in range(len(cols) - 1)
+            },
+        }
+
+    def _add(self, name, key):
+        """add the codes of a column"""
+        self.keys[name] = key
+        self.lencodec[name] = int(np.count_nonzero(np.bincount(key)))
+
+    def _remove(self, name):
+        """remove the codes and the relations of a column"""
+        if self.keys.pop(name, None) is None:
+            return
+        del self.lencodec[name]
+        self.relations = {
+            pair: rel for pair, rel in self.relations.items() if name not in pair
+        }
+
+    def _compute(self):
+        """compute the missing relations"""
+        cols = self.columns
+        pairs = [
+            (col, other)
+            for ind, col in enumerate(cols)
+            for other in cols[ind + 1 :]
+            if frozenset((col, other)) not in self.relations
+        ]
+        if not pairs:
+            return
+        # one task by worker: the keys are transferred once by worker
+        nb_task = min(self.workers or 1, len(pairs))
+        chunks = [pairs[ind::nb_task] for ind in range(nb_task)]
+        tasks = [
+            (chunk, {name: self.keys[name] for pair in chunk for name in pair})
+            for chunk in chunks
+        ]
+        results = PdUtil.map_series(
+            partial(_dist_pairs, distr=self.distr), tasks, self.workers, "process"
+        )
+        for chunk, dists in zip(chunks, results):
+            for pair, dist in zip(chunk, dists):
+                self.relations[frozenset(pair)] = dist
+            self.nb_computed += len(dists)
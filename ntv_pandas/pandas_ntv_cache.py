@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: philippe@loco-labs.io
+
+The `pandas_ntv_cache` module is part of the `ntv-pandas.ntv_pandas` package
+([specification document](
+https://loco-philippe.github.io/ES/JSON%20semantic%20format%20(JSON-NTV).htm)).
+
+It contains the functions of the on-disk cache used by `read_json_file` (parameter
+'cache'):
+
+- function `read_cache`: return the cached Series or DataFrame of a JSON file
+- function `write_cache`: store the Series or DataFrame of a JSON file in the cache
+- function `cache_path`: return the folder of the cache entry of a JSON file
+
+A cache entry is a folder with a 'meta.json' file (names, dtypes and layout of
+the columns) and a '.npy' file for each numpy array (values of the numeric and
+datetime columns, codes and categories of the categorical columns, values and
+mask of the nullable columns). The arrays are loaded as memory-mapped arrays
+(copy-on-write). The other columns are stored as NTV JSON values.
+
+The entry of a file is identified by the file path, the modification time and
+the size of the file and the `read_json` parameters. The outdated entries of a
+file are removed when a new entry is written.
+"""
+
+import os
+import glob
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+import pandas as pd
+
+from ntv_pandas.pandas_ntv_connector import read_json, to_json
+from ntv_pandas.pandas_ntv_json import json_dumps, json_loads
+
+CACHE_VERSION = 1
+"""version of the cache layout (the entries of another version are ignored)"""
+
+CACHE_META = "meta.json"
+"""name of the file with the description of a cache entry"""
+
+MASKED_ARRAYS = {
+    "i": pd.arrays.IntegerArray,
+    "u": pd.arrays.IntegerArray,
+    "f": pd.arrays.FloatingArray,
+    "b": pd.arrays.BooleanArray,
+}
+"""pandas nullable array by numpy dtype kind"""
+
+
+def cache_path(path, cache, option):
+    """return the folder of the cache entry of a JSON file.
+
+    *Parameters*
+
+    - **path** : string or Path - JSON file
+    - **cache** : string or Path - cache folder
+    - **option** : dict - `read_json` parameters
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    state = repr([stat.st_mtime_ns, stat.st_size, sorted(option.items())])
+    return os.path.join(cache, _digest(path) + "-" + _digest(state))
+
+
+def read_cache(path, cache, option):
+    """return the cached Series or DataFrame of a JSON file (None if the entry
+    does not exist).
+
+    *Parameters*
+
+    - **path** : string or Path - JSON file
+    - **cache** : string or Path - cache folder
+    - **option** : dict - `read_json` parameters
+    """
+    entry = cache_path(path, cache, option)
+    try:
+        with open(os.path.join(entry, CACHE_META), encoding="utf-8") as file:
+            meta = json_loads(file.read())
+    except (OSError, ValueError):
+        return None
+    if meta.get("version") != CACHE_VERSION:
+        return None
+    index = _load_index(meta["index"], entry, meta["length"])
+    if meta["kind"] == "series":
+        return _load_series(meta["data"], entry, meta["length"], index)
+    series = [_load_series(col, entry, meta["length"], index) for col in meta["data"]]
+    dfr = pd.DataFrame(dict(enumerate(series)), copy=False)
+    dfr.columns = [col["name"] for col in meta["data"]]
+    return dfr
+
+
+def write_cache(path, cache, option, pd_array):
+    """store the Series or DataFrame of a JSON file in the cache (the other
+    entries of the file are removed).
+
+    *Parameters*
+
+    - **path** : string or Path - JSON file
+    - **cache** : string or Path - cache folder
+    - **option** : dict - `read_json` parameters
+    - **pd_array** : Series or DataFrame to store
+    """
+    if not isinstance(pd_array, (pd.Series, pd.DataFrame)):
+        return
+    entry = cache_path(path, cache, option)
+    os.makedirs(cache, exist_ok=True)
+    folder = tempfile.mkdtemp(dir=cache)
+    files = []
+    meta = {
+        "version": CACHE_VERSION,
+        "length": len(pd_array),
+        "index": _save_index(pd_array.index, folder, files),
+    }
+    if isinstance(pd_array, pd.Series):
+        meta |= {"kind": "series", "data": _save_series(pd_array, folder, files)}
+    else:
+        data = [
+            _save_series(pd_array.iloc[:, ind], folder, files)
+            for ind in range(pd_array.shape[1])
+        ]
+        meta |= {"kind": "dataframe", "data": data}
+    with open(os.path.join(folder, CACHE_META), "w", encoding="utf-8") as file:
+        file.write(json_dumps(meta))
+    try:
+        os.rename(folder, entry)
+    except OSError:  # the entry is already written
+        shutil.rmtree(folder, ignore_errors=True)
+    prefix = os.path.basename(entry).split("-")[0]
+    for old in glob.glob(os.path.join(cache, prefix + "-*")):
+        if os.path.basename(old) != os.path.basename(entry):
+            shutil.rmtree(old, ignore_errors=True)
+
+
+def _digest(text):
+    """return the hash of a string"""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _save_array(values, folder, files):
+    """write a numpy array in a '.npy' file and return the file name"""
+    name = str(len(files)) + ".npy"
+    np.save(os.path.join(folder, name), np.ascontiguousarray(values))
+    files.append(name)
+    return name
+
+
+def _load_array(name, entry):
+    """return a memory-mapped array (ndarray view) from a '.npy' file"""
+    return np.asarray(np.load(os.path.join(entry, name), mmap_mode="c"))
+
+
+def _save_series(srs, folder, files):
+    """write the arrays of a Series and return its description"""
+    dtype = srs.dtype
+    meta = {"name": srs.name}
+    if isinstance(dtype, pd.CategoricalDtype):
+        categories = pd.Series(dtype.categories)
+        return meta | {
+            "kind": "category",
+            "ordered": bool(dtype.ordered),
+            "length": len(categories),
+            "codes": _save_array(srs.cat.codes.to_numpy(), folder, files),
+            "categories": _save_series(categories, folder, files),
+        }
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+        return meta | {
+            "kind": "array",
+            "values": _save_array(srs.to_numpy(), folder, files),
+        }
+    if isinstance(srs.array, tuple(MASKED_ARRAYS.values())):
+        values = srs.array.to_numpy(dtype=dtype.numpy_dtype, na_value=dtype.type(0))
+        return meta | {
+            "kind": "masked",
+            "values": _save_array(values, folder, files),
+            "mask": _save_array(srs.isna().to_numpy(), folder, files),
+        }
+    return meta | {"kind": "json", "dtype": dtype.name, "value": to_json(srs)}
+
+
+def _load_series(meta, entry, leng, index=None):
+    """return a Series from its description (the arrays are not copied)"""
+    kind = meta["kind"]
+    if kind == "category":
+        categories = pd.Index(_load_series(meta["categories"], entry, meta["length"]))
+        cat = pd.CategoricalDtype(categories=categories, ordered=meta["ordered"])
+        data = pd.Categorical.from_codes(_load_array(meta["codes"], entry), dtype=cat)
+    elif kind == "array":
+        data = _load_array(meta["values"], entry)
+    elif kind == "masked":
+        values = _load_array(meta["values"], entry)
+        data = MASKED_ARRAYS[values.dtype.kind](
+            values, _load_array(meta["mask"], entry)
+        )
+    else:
+        data = read_json(meta["value"], leng=leng)
+        if data.dtype.name != meta["dtype"]:
+            data = data.astype(meta["dtype"])
+        data.name = meta["name"]
+        if index is not None:
+            data.index = index
+        return data
+    return pd.Series(data, index=index, name=meta["name"], copy=False)
+
+
+def _save_index(index, folder, files):
+    """write the arrays of an index and return its description"""
+    if isinstance(index, pd.RangeIndex):
+        return {
+            "kind": "range",
+            "name": index.name,
+            "range": [index.start, index.stop, index.step],
+        }
+    return _save_series(index.to_series(index=None), folder, files)
+
+
+def _load_index(meta, entry, leng):
+    """return an index from its description"""
+    if meta["kind"] == "range":
+        return pd.RangeIndex(*meta["range"], name=meta["name"])
+    return pd.Index(_load_series(meta, entry, leng), name=meta["name"])
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: philippe@loco-labs.io
+
+The `pandas_ntv_codec` module is part of the `ntv-pandas.ntv_pandas` package
+([specification document](
+https://loco-philippe.github.io/ES/JSON%20semantic%20format%20(JSON-NTV).htm)).
+
+It contains the cache of the decoded codecs used by `SeriesConnec.from_field`
+(a codec shared by several fields or several calls is decoded once):
+
+- class `CodecCache`: bounded LRU cache of the categorical dtypes of the codecs
+- function `codec_cache_info`: return the statistics of the cache
+- function `codec_cache_clear`: remove the entries and reset the statistics
+- function `set_codec_cache`: set the maximal size of the cache
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+from ntv_pandas.pandas_ntv_json import json_dumps
+
+CODEC_CACHE_SIZE = 2**26
+"""default maximal size of the codec cache (bytes of the JSON text of the codecs)"""
+
+
+class CodecCache:
+    """Bounded LRU cache of decoded codecs.
+
+    The key of an entry is the content hash of the codec (JSON values) and of its
+    NTV type, the size of an entry is the length in bytes of the JSON text of the
+    codec. The least recently used entries are removed when the size of the cache
+    exceeds the maximal size.
+
+    *Attributes :*
+
+    - **maxsize** : integer - maximal size of the cache in bytes (0 if the cache
+    is disabled)
+    - **size** : integer - size of the cache in bytes
+    - **hits** : integer - number of entries found
+    - **misses** : integer - number of entries not found
+    """
+
+    def __init__(self, maxsize=CODEC_CACHE_SIZE):
+        """CodecCache constructor.
+
+        *Parameters*
+
+        - **maxsize** : integer (default CODEC_CACHE_SIZE) - maximal size of the
+        cache in bytes
+        """
+        self.maxsize = maxsize
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """number of entries"""
+        return len(self._entries)
+
+    @staticmethod
+    def key(*values):
+        """return a tuple with the content hash of JSON values and the length in
+        bytes of their JSON text (None if the values are not JSON values)"""
+        try:
+            text = json_dumps(list(values)).encode("utf-8")
+        except (TypeError, ValueError, OverflowError):
+            return None
+        return (hashlib.blake2b(text, digest_size=16).digest(), len(text))
+
+    def get(self, key):
+        """return the value of an entry (None if the entry is not found)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, size):
+        """add an entry (not added if its size in bytes exceeds the maximal size)"""
+        if size > self.maxsize:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return
+            self._entries[key] = (value, size)
+            self.size += size
+            self._evict()
+
+    def resize(self, maxsize):
+        """set the maximal size of the cache (the entries in excess are removed)"""
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self):
+        """remove the entries and reset the statistics"""
+        with self._lock:
+            self._entries.clear()
+            self.size = self.hits = self.misses = 0
+
+    def info(self):
+        """return the statistics of the cache"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "size": self.size,
+            "maxsize": self.maxsize,
+        }
+
+    def _evict(self):
+        """remove the least recently used entries to respect the maximal size"""
+        while self.size > self.maxsize:
+            self.size -= self._entries.popitem(last=False)[1][1]
+
+
+CODEC_CACHE = CodecCache()
+"""codec cache used by `SeriesConnec.from_field`"""
+
+
+def codec_cache_info():
+    """return the statistics of the codec cache (dict with 'hits', 'misses',
+    'entries', 'size' and 'maxsize' keys)"""
+    return CODEC_CACHE.info()
+
+
+def codec_cache_clear():
+    """remove the entries of the codec cache and reset the statistics"""
+    CODEC_CACHE.clear()
+
+
+def set_codec_cache(maxsize=CODEC_CACHE_SIZE):
+    """set the maximal size of the codec cache.
+
+    *Parameters*
+
+    - **maxsize** : integer (default CODEC_CACHE_SIZE) - maximal size of the cache
+    in bytes of the JSON text of the codecs (0 to disable the cache)
+    """
+    CODEC_CACHE.resize(maxsize)
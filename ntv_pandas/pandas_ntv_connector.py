@@ -18,7 +18,8 @@ It contains :
 
 - functions `read_json` and `to_json` to convert JSON data and pandas entities
 - function `to_analysis` to create data used by the `tab_analysis` module
-- function `check_relation` to identify rows with inconsistent relationships
+- functions `check_relation` and `check_relations` to identify rows with
+inconsistent relationships
 - functions `as_def_type` and `equals`
 
 - the child classes of `NTV.json_ntv.ntv.NtvConnector` abstract class:
@@ -33,21 +34,27 @@ The functions `to_json`, `to_analysis`, `check_relation`, `as_def_type` and
 """
 
 import os
+import re
 import datetime
 import json
 import configparser
 from pathlib import Path
-from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from functools import partial
+from typing import ClassVar
+from operator import itemgetter
 from io import StringIO
 import pandas as pd
 import numpy as np
 
 
 from json_ntv.ntv import Ntv, NtvConnector, NtvList, NtvSingle
-from json_ntv.ntv_util import NtvUtil
-from json_ntv.ntv_connector import ShapelyConnec
-from tab_dataset.cfield import Cfield
+from json_ntv.ntv_util import NtvUtil, NtvError
+from tab_dataset.cfield import FieldError
 from ntv_numpy import Xdataset
+from ntv_pandas.pandas_ntv_json import json_dumps, json_loads
+from ntv_pandas.pandas_ntv_codec import CODEC_CACHE, CodecCache
+from ntv_pandas import pandas_ntv_geo
 
 path_ntv_pandas = Path(os.path.abspath(__file__)).parent
 
@@ -78,11 +85,103 @@ def check_relation(pd_df, parent, child, typecoupl, value=True):
 
     - dict with inconsistent values of the Series
     - or a tuple with row of records"""
-    parent_idx = SeriesConnec.to_idx(pd_df[parent])
-    parent_field = Cfield(parent_idx["codec"], parent, parent_idx["keys"])
-    child_idx = SeriesConnec.to_idx(pd_df[child])
-    child_field = Cfield(child_idx["codec"], child, child_idx["keys"])
-    return Cfield.check_relation(parent_field, child_field, typecoupl, value)
+    return check_relations(pd_df, [(parent, child, typecoupl)], value)[0]
+
+
+def check_relations(pd_df, relations, value=True):
+    """Get the inconsistent records for a list of relationships (the codes of
+    each Series and the inconsistent records of each couple of Series are
+    computed once).
+
+     *Parameters*
+
+    - **relations** : list of tuple (parent, child, typecoupl) - relationships
+    to check (see `check_relation`)
+    - **value**: boolean (default True) - if True return a dict with inconsistent
+    values of the Series, else a tuple with index of records)
+
+    *Returns* : list (one item by relationship) of:
+
+    - dict with inconsistent values of the Series
+    - or a tuple with row of records"""
+    codes = {}
+    for name in {name for relation in relations for name in relation[:2]}:
+        idx = SeriesConnec.to_idx(pd_df[name], as_array=True)
+        codes[name] = (idx, idx["keys"].astype("int64") + 1)
+    duplicates = {}
+
+    def dupl(name, other):
+        if (name, other) not in duplicates:
+            duplicates[name, other] = _duplicates(codes[name][1], codes[other][1])
+        return duplicates[name, other]
+
+    result = []
+    for parent, child, typecoupl in relations:
+        match typecoupl:
+            case "derived":
+                errors = dupl(parent, child)
+            case "coupled":
+                errors = dupl(child, parent)
+                if len(errors):
+                    errors = np.union1d(errors, dupl(parent, child))
+                else:
+                    errors = dupl(parent, child)
+            case _:
+                raise FieldError(typecoupl + "is not a valid relationship")
+        errors = tuple(errors.tolist())
+        if not value:
+            result.append(errors)
+            continue
+        result.append(
+            {
+                "row": list(errors),
+                child: _values(codes[child][0], errors),
+                parent: _values(codes[parent][0], errors),
+            }
+        )
+    return result
+
+
+def _duplicates(key, other):
+    """return the rows where the value of key is associated to several values
+    of other (same order as `Cfield.getduplicates`).
+
+    The keys are numpy arrays of positive integers (pandas codes + 1)."""
+    if not len(key):
+        return np.array([], dtype="int64")
+    base = int(other.max()) + 1
+    k1k2 = key * base + other
+    small = (int(key.max()) + 1) * base <= 4 * len(key) + 1024
+    if small:
+        first = np.full((int(key.max()) + 1) * base, len(key))
+        np.minimum.at(first, k1k2, np.arange(len(key)))
+        pairs = np.flatnonzero(first < len(key))
+    else:
+        pairs, first, inverse = np.unique(k1k2, return_index=True, return_inverse=True)
+    several = np.bincount(pairs // base) > 1
+    rows = np.flatnonzero(several[key])
+    if not len(rows):
+        return rows
+    pair_first = first[k1k2[rows]] if small else first[inverse.reshape(-1)[rows]]
+    key_first = np.full(len(several), len(key))
+    np.minimum.at(key_first, key, np.arange(len(key)))
+    # rows are grouped by value and by couple of values (first occurrence order)
+    return rows[np.lexsort((rows, pair_first, key_first[key[rows]]))]
+
+
+def _values(idx, rows):
+    """return the values (None for NaN) of categorical data (`SeriesConnec.to_idx`
+    with as_array) for a list of rows"""
+    codes = idx["keys"][list(rows)]
+    values = list(idx["codec"][np.maximum(codes, 0)]) if len(codes) else []
+    return [
+        None
+        if cod < 0
+        else val.to_pydatetime().astimezone(datetime.timezone.utc)
+        if isinstance(val, pd.Timestamp)
+        else val
+        for cod, val in zip(codes, values)
+    ]
 
 
 def equals(pdself, pdother):
@@ -99,7 +198,8 @@ def read_json(jsn, **kwargs):
 
     *parameters*
 
-    - **jsn** : JSON text or JSON value to convert
+    - **jsn** : JSON text, CBOR bytes (see `to_json` 'cbor' format) or JSON value
+    to convert
     - **extkeys**: list (default None) - keys to use if not present in ntv_value
     - **decode_str**: boolean (default False) - if True, string values are converted
     in object values
@@ -108,6 +208,18 @@ def read_json(jsn, **kwargs):
     - **annotated**: boolean (default False) - if True, ntv_codec names are ignored
     - **series**: boolean (default False) - used only without header. If True
     JSON data is converted into Series else DataFrame
+    - **workers** : integer (default None) - if not None, number of workers used
+    to build the DataFrame Series concurrently
+    - **executor** : string (default 'thread') - pool of workers ('thread' or 'process')
+    - **lazy** : boolean (default False) - if True, a NTV tab is converted into a
+    `LazyFrame` (the Series of a field is generated on first access), a NTV field
+    or a TableSchema raises NtvError
+    - **columns** : list (default None) - names of the fields to read (NTV tab and
+    TableSchema), all the fields if None (the 'index' field is always read)
+    - **rows** : slice (default None) - rows to read (NTV tab and TableSchema), all
+    the rows if None
+    - **nrows** : integer (default None) - number of rows to read from the first row
+    (same as `rows=slice(nrows)`)
     """
     option = {
         "extkeys": None,
@@ -116,10 +228,30 @@ def read_json(jsn, **kwargs):
         "alias": False,
         "annotated": False,
         "series": False,
+        "lazy": False,
+        "columns": None,
+        "rows": None,
+        "nrows": None,
     } | kwargs
-    jso = json.loads(jsn) if isinstance(jsn, str) else jsn
+    option["rows"] = PdUtil.row_slice(option["rows"], option.pop("nrows"))
+    if isinstance(jsn, (bytes, bytearray, memoryview)):
+        jso = PdUtil.from_cbor(jsn)
+    else:
+        jso = json_loads(jsn) if isinstance(jsn, str) else jsn
+    if option.pop("lazy"):
+        # the pandas_ntv_lazy module imports this module
+        from ntv_pandas.pandas_ntv_lazy import LazyFrame
+
+        return LazyFrame.from_json(jso, **option)
     if "schema" in jso:
         return PdUtil.to_obj_table(jso, **option)
+    if not option["series"] and (
+        option["columns"] is not None or option["rows"] is not None
+    ):
+        return DataFrameConnec.to_obj_ntv(jso, **option)
+    pd_array = PdUtil.read_arrays(jso, **option)
+    if pd_array is not None:
+        return pd_array
     ntv = Ntv.from_obj(jso)
     if ntv.type_str == "field":
         return SeriesConnec.to_obj_ntv(ntv.ntv_value, **option)
@@ -130,38 +262,168 @@ def read_json(jsn, **kwargs):
     return DataFrameConnec.to_obj_ntv(ntv.ntv_value, **option)
 
 
+TYPED_ARRAYS = {
+    "|u1": 64,
+    "<u2": 69,
+    "<u4": 70,
+    "<u8": 71,
+    "|i1": 72,
+    "<i2": 77,
+    "<i4": 78,
+    "<i8": 79,
+    "<f2": 84,
+    "<f4": 85,
+    "<f8": 86,
+}
+"""CBOR tags of the typed arrays (RFC 8746, little endian) by numpy dtype"""
+
+TABLE_CONVERT = (
+    "point",
+    "line",
+    "polygon",
+    "geometry",
+    "geojson",
+    "datetime",
+    "date",
+    "time",
+)
+"""NTVtypes of the TableSchema json-values converted by PdUtil.convert"""
+
+ISO_DATETIME = re.compile(
+    r"\d{4}-\d{2}-\d{2}"
+    r"(?:(?P<sep>[T ])\d{2}:\d{2}(?P<sec>:\d{2})?(?P<frac>\.\d{1,9})?)?"
+    r"(?P<zone>Z|[+-]\d{2}:?\d{2})?"
+)
+"""ISO 8601 layout of the 'date' and 'datetime' values"""
+
+ISO_TIME = re.compile(r"\d{2}:\d{2}(?P<sec>:\d{2})?(?P<frac>\.\d{1,6})?")
+"""ISO 8601 layout of the 'time' values"""
+
+TEMPORAL_SAMPLE = 100
+"""number of values used to detect the format of a temporal Series"""
+
+TEMPORAL_CACHE_SIZE = 1024
+"""maximal number of formats kept in TEMPORAL_FORMATS"""
+
+TEMPORAL_FORMATS = {}
+"""format of the temporal Series by (NTVtype, name) detected by PdUtil.to_temporal"""
+
+APPROX_SIZE = 2**14
+"""number of values of a column sampled in the approximate analysis"""
+
+
+def _mix64(val):
+    """return the splitmix64 finalizer of an int64 array (uint64 hash values)"""
+    hsh = val.astype(np.uint64)
+    hsh = (hsh ^ (hsh >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    hsh = (hsh ^ (hsh >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return hsh ^ (hsh >> np.uint64(31))
+
+
+def _sample(key, lencodec, size=APPROX_SIZE):
+    """return a hashed sample of the values of a keys array (None if the number
+    of values is lower than 4 * size).
+
+    The sample is a tuple with the rows of the sampled values and the number
+    of sampled values."""
+    if lencodec < 4 * size:
+        return None
+    values = np.bincount(key) > 0
+    values &= _mix64(np.arange(len(values))) < np.uint64(size / lencodec * 2.0**64)
+    return (np.flatnonzero(values[key]), int(np.count_nonzero(values)))
+
+
+def _approx_dist(key1, key2, lencodec, sample, distr=False):
+    """return the estimated default coupling codec between two keys arrays and
+    optionaly if the relationship is distributed.
+
+    The distinct couples are counted in the rows of the sampled values of the
+    first key and the count is extrapolated to all the values. The estimate is
+    bounded by the exact limits (max and product of lencodec, length) and is
+    set to a limit if the gap is lower than three standard errors."""
+    rows, nb_sample = sample
+    k1k2 = key1[rows] * (int(key2.max()) + 1) + key2[rows]
+    counts = np.unique(k1k2, return_counts=True)[1]
+    estimate = len(counts) * lencodec[0] / nb_sample
+    low = max(lencodec)
+    high = min(lencodec[0] * lencodec[1], len(key1))
+    tol = 3 / nb_sample**0.5
+    if estimate <= low * (1 + tol):
+        dist = low
+    elif estimate >= high * (1 - tol):
+        dist = high
+    else:
+        dist = round(estimate)
+    if not distr:
+        return dist
+    distrib = False
+    if dist == int(key1.max()) * int(key2.max()):
+        distrib = bool(counts.max() == len(key1) // dist)
+    return [dist, distrib]
+
+
 def _dist(key1, key2, distr=False):
-    """return default coupling codec between two keys list and optionaly if
-    the relationship is distributed"""
-    if not key1 or not key2:
+    """return default coupling codec between two keys arrays and optionaly if
+    the relationship is distributed.
+
+    The keys are numpy arrays of positive integers (pandas codes + 1), each
+    couple of keys is combined in a single integer."""
+    if not len(key1) or not len(key2):
         return 0
-    k1k2 = [tuple((v1, v2)) for v1, v2 in zip(key1, key2)]
-    dist = len(list(dict.fromkeys(k1k2)))
+    max1, max2 = int(key1.max()), int(key2.max())
+    k1k2 = key1 * (max2 + 1) + key2
+    if (max1 + 1) * (max2 + 1) <= 4 * len(k1k2) + 1024:
+        counts = np.bincount(k1k2)
+        dist = int(np.count_nonzero(counts))
+    else:
+        counts = np.unique(k1k2, return_counts=True)[1]
+        dist = len(counts)
     if not distr:
         return dist
     distrib = False
-    if dist == (max(key1) + 1) * (max(key2) + 1):
-        distrib = max(Counter(k1k2).values()) == len(key1) // dist
-        # distrib = min(sum(map(lambda x: (x + i) % (max(a) + 1), a)) == sum(a)
-        # for i in range(1, max(a)+1))
+    if dist == max1 * max2:
+        distrib = bool(counts.max() == len(key1) // dist)
     return [dist, distrib]
 
 
-def to_analysis(pd_df, distr=False):
-    """return a dict with data used in AnaDataset module"""
+def to_analysis(pd_df, distr=False, approx=False):
+    """return a dict with data used in AnaDataset module.
 
-    keys = [list(pd_df[col].astype("category").cat.codes) for col in pd_df.columns]
-    lencodec = [len(set(key)) for key in keys]
-    if distr:
-        dist = [
-            [_dist(keys[i], keys[j], distr) for j in range(i + 1, len(keys))]
-            for i in range(len(keys) - 1)
-        ]
-    else:
-        dist = [
-            [len(set(zip(keys[i], keys[j]))) for j in range(i + 1, len(keys))]
-            for i in range(len(keys) - 1)
-        ]
+    *parameters*
+
+    - **pd_df** : DataFrame to analyse
+    - **distr** : boolean (default False) - if True the relations include
+    the distributed indicator
+    - **approx** : boolean (default False) - if True the relations with a high
+    cardinality column are estimated with a hashed sample of its values
+    """
+
+    keys = [
+        SeriesConnec.to_idx(pd_df[col], as_array=True)["keys"].astype("int64") + 1
+        for col in pd_df.columns
+    ]
+    lencodec = [int(np.count_nonzero(np.bincount(key))) for key in keys]
+    samples = [
+        _sample(key, lenc) if approx else None for key, lenc in zip(keys, lencodec)
+    ]
+    dist = []
+    for i in range(len(keys) - 1):
+        dist.append([])
+        for j in range(i + 1, len(keys)):
+            # the sample of the column with the highest cardinality is used
+            ind1, ind2 = (i, j) if lencodec[i] >= lencodec[j] else (j, i)
+            if samples[ind1]:
+                dist[i].append(
+                    _approx_dist(
+                        keys[ind1],
+                        keys[ind2],
+                        (lencodec[ind1], lencodec[ind2]),
+                        samples[ind1],
+                        distr,
+                    )
+                )
+            else:
+                dist[i].append(_dist(keys[i], keys[j], distr))
     return {
         "fields": [
             {
@@ -188,26 +450,61 @@ def to_json(pd_array, **kwargs):
     *parameters*
 
     - **pd_array** : Series or Dataframe to convert
-    - **encoded** : boolean (default: False) - if True return a JSON text else a JSON value
+    - **encoded** : boolean (default: False) - if True return a JSON text (CBOR
+    bytes with 'cbor' format) else a JSON value
     - **header** : boolean (default: True) - if True the JSON data is included as
     value in a {key:value} object where key is ':field' for Series or ':tab' for DataFrame
     - **table** : boolean (default False) - if True return TableSchema format
     - **index** : boolean (default True) - if True the index Series is included
+    - **workers** : integer (default None) - if not None, number of workers used
+    to encode the DataFrame columns concurrently (NTV tab format)
+    - **executor** : string (default 'thread') - pool of workers ('thread' or 'process')
+    - **optimize** : boolean (default False) - if True each column is encoded
+    with the smallest format (full, codec+keys or 'coef', see `PdUtil.optimize`),
+    the columns encoded with codec+keys are read as categorical Series (NTV format)
+    - **format** : string (default 'json') - 'json' or 'cbor' (binary format, the
+    values of the integer and float columns are numpy arrays encoded as CBOR
+    typed arrays, the cbor2 package is required to encode)
     """
-    option = {"encoded": False, "header": True, "table": False, "index": True} | kwargs
+    option = {
+        "encoded": False,
+        "header": True,
+        "table": False,
+        "index": True,
+        "workers": None,
+        "executor": "thread",
+        "optimize": False,
+        "format": "json",
+    } | kwargs
+    if option["format"] not in ("json", "cbor"):
+        raise NtvError("the format is not 'json' or 'cbor'")
+    binary = option["format"] == "cbor" and not option["table"]
     option["header"] = False if option["table"] else option["header"]
     if isinstance(pd_array, pd.Series):
-        jsn = SeriesConnec.to_json_ntv(pd_array, table=option["table"])[0]
+        srs = pd_array
+        if option["optimize"] and not option["table"]:
+            srs = PdUtil.optimize(srs, coef=False)
+        jsn = PdUtil.array_field(srs) if binary else None
+        if jsn is None:
+            jsn = SeriesConnec.to_json_ntv(srs, table=option["table"])[0]
         head = ":field"
     else:
         jsn = DataFrameConnec.to_json_ntv(
-            pd_array, table=option["table"], index=option["index"]
+            pd_array,
+            table=option["table"],
+            index=option["index"],
+            workers=option["workers"],
+            executor=option["executor"],
+            optimize=option["optimize"],
+            binary=binary,
         )[0]
         head = ":tab"
     if option["header"]:
         jsn = {head: jsn}
+    if option["encoded"] and option["format"] == "cbor":
+        return PdUtil.to_cbor(jsn)
     if option["encoded"]:
-        return json.dumps(jsn)
+        return json_dumps(jsn)
     return jsn
 
 
@@ -238,8 +535,9 @@ def from_scipp(sci, **kwargs):
 class DataFrameConnec(NtvConnector):
     """NTV connector for pandas DataFrame.
 
-    One static methods is included:
+    Two static methods are included:
 
+    - iter_series: generate the Series of a DataFrame from decoded fields
     - to_listidx: convert a DataFrame in categorical data
     """
 
@@ -254,33 +552,69 @@ class DataFrameConnec(NtvConnector):
 
         - **index** : list (default None) - list of index values,
         - **alias** : boolean (default False) - if True, alias dtype else default dtype
-        - **annotated** : boolean (default False) - if True, NTV names are not included."""
-        series = SeriesConnec.to_series
-
+        - **annotated** : boolean (default False) - if True, NTV names are not included.
+        - **workers** : integer (default None) - if not None, number of workers used
+        to build the Series concurrently
+        - **executor** : string (default 'thread') - pool of workers ('thread' or 'process')
+        - **columns** : list (default None) - names of the fields to read (all the
+        fields if None)
+        - **rows** : slice (default None) - rows to read (all the rows if None)
+
+        With 'columns' or 'rows', only the selected fields (and their parent
+        fields) are decoded and the keys are sliced before the Series are generated."""
+        if kwargs.get("columns") is not None or kwargs.get("rows") is not None:
+            # the pandas_ntv_lazy module imports this module
+            from ntv_pandas.pandas_ntv_lazy import LazyFrame
+
+            lazy = LazyFrame.from_json(ntv_value, **kwargs)
+            return lazy.to_pandas(kwargs.get("columns"), kwargs.get("rows"))
         ntv = Ntv.fast(ntv_value)
         lidx = [
             list(NtvUtil.decode_ntv_tab(ntvf, PdUtil.decode_ntv_to_val)) for ntvf in ntv
         ]
-        leng = max([idx[6] for idx in lidx])
+        dfr = pd.DataFrame(
+            {ser.name: ser for ser in DataFrameConnec.iter_series(lidx, **kwargs)}
+        )
+        return PdUtil.pd_index(dfr)
+
+    @staticmethod
+    def iter_series(lidx, **kwargs):
+        """generate the Series of a DataFrame from decoded fields.
+
+        *Parameters*
+
+        - **lidx** : list - data of each field (`NtvUtil.decode_ntv_tab` list)
+        - **leng** : integer (default None) - minimal length of the Series
+        - **alias** : boolean (default False) - if True, alias dtype else default dtype
+        - **annotated** : boolean (default False) - if True, NTV names are not included.
+        - **workers** : integer (default None) - if not None, number of workers used
+        to build the Series concurrently
+        - **executor** : string (default 'thread') - pool of workers ('thread' or 'process')
+
+        The keys of all fields are resolved first, then each Series is generated
+        and its field data is released from lidx (all the Series are generated
+        at once with workers)."""
+        leng = max([idx[6] for idx in lidx] + [kwargs.get("leng") or 0])
         option = kwargs | {"leng": leng}
+        workers = option.pop("workers", None)
+        executor = option.pop("executor", "thread")
         no_keys = []
         for ind, lind in enumerate(lidx):
             no_keys.append(not lind[3] and not lind[4] and not lind[5])
-            NtvConnector.init_ntv_keys(ind, lidx, leng)
-            lind[2] = Ntv.fast(
-                Ntv.obj_ntv(lind[2], typ=lind[1], single=len(lind[2]) == 1)
-            )
-        list_series = [
-            series(
-                lidx[ind][2],
-                lidx[ind][0],
-                None if no_keys[ind] else lidx[ind][4],
-                **option,
-            )
-            for ind in range(len(lidx))
+            NtvConnector.init_ntv_keys(ind, lidx, option["leng"])
+        fields = [
+            (lind[0], lind[1], lind[2], None if no_keys[ind] else lind[4])
+            for ind, lind in enumerate(lidx)
         ]
-        dfr = pd.DataFrame({ser.name: ser for ser in list_series})
-        return PdUtil.pd_index(dfr)
+        lidx[:] = [None] * len(lidx)
+        if workers:
+            yield from PdUtil.map_series(
+                partial(SeriesConnec.from_field, **option), fields, workers, executor
+            )
+            return
+        for ind, field in enumerate(fields):
+            yield SeriesConnec.from_field(field, **option)
+            fields[ind] = None
 
     @staticmethod
     def to_json_ntv(value, name=None, typ=None, **kwargs):
@@ -293,48 +627,65 @@ class DataFrameConnec(NtvConnector):
         - **value** : DataFrame values
         - **table** : boolean (default False) - if True return TableSchema format
         - **index** : boolean (default True) - if True the index Series is included
+        - **workers** : integer (default None) - if not None, number of workers used
+        to encode the columns concurrently (NTV tab format)
+        - **executor** : string (default 'thread') - pool of workers ('thread' or 'process')
+        - **optimize** : boolean (default False) - if True each column is encoded
+        with the smallest format (NTV tab format)
+        - **binary** : boolean (default False) - if True the values of the numeric
+        columns are numpy arrays (NTV tab format)
         """
         table = kwargs.get("table", False)
         index = kwargs.get("index", True)
         if not table:
             df2 = value.reset_index() if index else value
-            jsn = Ntv.obj(
-                [
-                    SeriesConnec.to_json_ntv(PdUtil.unic(df2[col]))[0]
-                    for col in df2.columns
-                ]
-            ).to_obj()
+            series = [df2[col] for col in df2.columns]
+            optimize = kwargs.get("optimize", False)
+            fields = PdUtil.map_series(
+                partial(
+                    PdUtil.json_field,
+                    optimize=optimize,
+                    binary=kwargs.get("binary", False),
+                    coef=optimize and any(map(PdUtil.explicit_length, series)),
+                ),
+                series,
+                kwargs.get("workers"),
+                kwargs.get("executor", "thread"),
+            )
+            # same JSON value as Ntv.obj(fields).to_obj()
+            if len(fields) == 1 or not NtvUtil.is_dictable(fields):
+                jsn = fields
+            else:
+                jsn = {key: val for field in fields for key, val in field.items()}
             return (jsn, name, DataFrameConnec.clas_typ if not typ else typ)
-        df2 = pd.DataFrame(
-            {
-                NtvUtil.from_obj_name(col)[0]: PdUtil.convert(
-                    SeriesConnec.to_json_ntv(value[col], table=True, no_val=True)[1],
-                    value[col],
-                )
-                for col in value.columns
-            }
-        )
-        table_val = json.loads(
-            df2.to_json(orient="table", date_format="iso", default_handler=str)
-        )
-        for nam in value.columns:
+        columns = []
+        for col in value.columns:
             ntv_name, ntv_type = SeriesConnec.to_json_ntv(
-                value[nam], table=True, no_val=True
-            )
-            table_val["schema"] = PdUtil.table_schema(
-                table_val["schema"], ntv_name, ntv_type
+                value[col], table=True, no_val=True
             )
+            srs = PdUtil.convert(ntv_type, value[col]).rename(ntv_name)
+            columns.append((srs, ntv_type))
+        table_val = PdUtil.table_json(columns, value.index)
         return (table_val, name, DataFrameConnec.clas_typ if not typ else typ)
 
     @staticmethod
-    def to_listidx(dtf):
+    def to_listidx(dtf, as_array=False):
         """convert a DataFrame in categorical data
 
+        *Parameters*
+
+        - **dtf** : DataFrame to convert
+        - **as_array** : boolean (default False) - if True, codec and keys are
+        pandas categories and numpy codes (see `SeriesConnec.to_idx`)
+
         *Return: tuple with:*
 
         - **list** of dict (keys : 'codec', 'name, 'keys') for each column
         - **lenght** of the DataFrame"""
-        return ([SeriesConnec.to_idx(ser) for name, ser in dtf.items()], len(dtf))
+        return (
+            [SeriesConnec.to_idx(ser, as_array) for name, ser in dtf.items()],
+            len(dtf),
+        )
 
     @staticmethod
     def equals(pdself, pdother):
@@ -352,9 +703,10 @@ class DataFrameConnec(NtvConnector):
 class SeriesConnec(NtvConnector):
     """NTV connector for pandas Series
 
-    Two static methods are included:
+    Three static methods are included:
 
     - to_idx: convert a Series in categorical data
+    - from_field: return a Series from decoded field data
     - to_series: return a Series from Field data
     """
 
@@ -366,7 +718,7 @@ class SeriesConnec(NtvConnector):
         json.loads(config["data"]["type"]), columns=json.loads(config["data"]["column"])
     )
     astype = json.loads(config["data"]["astype"])
-    deftype = {val: key for key, val in astype.items()}
+    deftype: ClassVar[dict] = {val: key for key, val in astype.items()}
     config = configparser.ConfigParser()
     config.read(path_ntv_pandas.joinpath("ntv_table.ini"))
     table = pd.DataFrame(
@@ -378,6 +730,26 @@ class SeriesConnec(NtvConnector):
         columns=json.loads(config["data"]["col_type"]),
     )
 
+    # type registry: dict lookups built once from the configuration tables
+    types_ntv: ClassVar[dict] = {
+        ntv: (nam, dty) for ntv, nam, dty in types.values.tolist()
+    }
+    types_dtype: ClassVar[dict] = {
+        dty: ntv for ntv, nam, dty in types.values.tolist()[::-1] if nam is None
+    }
+    typtab_ntv: ClassVar[dict] = {
+        ntv: (nam, dty) for ntv, nam, dty in typtab.values.tolist()
+    }
+    typtab_dtype: ClassVar[dict] = {
+        dty: ntv for ntv, nam, dty in typtab.values.tolist()[::-1] if nam is None
+    }
+    table_ntv: ClassVar[dict] = {
+        ntv: (fmt, typ) for ntv, fmt, typ in table.values.tolist()
+    }
+    table_type: ClassVar[dict] = {
+        (typ, fmt): ntv for ntv, fmt, typ in table.values.tolist()[::-1]
+    }
+
     @staticmethod
     def to_obj_ntv(ntv_value, **kwargs):
         """Generate a Series Object from a Ntv field object
@@ -442,19 +814,24 @@ class SeriesConnec(NtvConnector):
 
         if table:
             ntv_type = PdUtil.ntv_type(name_type, srs.dtype.name, table=True)
-            ntv_value = PdUtil.table_val(ntv_type, ntv_name, srs)
             if no_val:
                 return (ntv_name, ntv_type)
+            ntv_value = PdUtil.table_val(ntv_type, ntv_name, srs)
             return (ntv_value, ntv_name, ntv_type)
         if srs.dtype.name == "category":
             cdc = pd.Series(srs.cat.categories)
             ntv_type = PdUtil.ntv_type(name_type, cdc.dtype.name)
             cat_value = PdUtil.ntv_val(ntv_type, cdc)
-            cat_value = NtvList(cat_value, ntv_type=ntv_type)
-            cod_value = list(srs.cat.codes)
-            coef = NtvConnector.encode_coef(cod_value)
-            ntv_value = [cat_value, NtvList([coef]) if coef else NtvList(cod_value)]
-            ntv_type = None
+            cat_value = NtvList(cat_value, ntv_type=ntv_type).to_obj()
+            cod_value = srs.cat.codes.to_numpy()
+            coef = PdUtil.encode_coef(cod_value)
+            # same JSON value as NtvList([cat_value, keys], ntv_name).to_obj()
+            jsn = [cat_value, [coef] if coef else cod_value.tolist()]
+            return (
+                {ntv_name: jsn} if ntv_name else jsn,
+                name,
+                SeriesConnec.clas_typ if not typ else typ,
+            )
         else:
             ntv_type = PdUtil.ntv_type(name_type, srs.dtype.name)
             ntv_value = Ntv.from_obj(
@@ -474,21 +851,65 @@ class SeriesConnec(NtvConnector):
         )
 
     @staticmethod
-    def to_idx(ser):
+    def to_idx(ser, as_array=False):
         """convert a Series in categorical data
 
+        *Parameters*
+
+        - **ser** : Series to convert
+        - **as_array** : boolean (default False) - if True, codec is the pandas
+        categories (Index) and keys is the numpy array of pandas codes (int8,
+        int16, int32 or int64), both without copy of the Categorical data
+
         *return (dict)*
 
         { 'codec': 'list of pandas categories',
           'name': 'name of the series',
           'keys': 'list of pandas codes' }
         """
-        idx = ser.astype("category")
+        idx = ser if ser.dtype.name == "category" else ser.astype("category")
+        if as_array:
+            return {
+                "codec": idx.cat.categories,
+                "name": ser.name,
+                "keys": idx.cat.codes.to_numpy(),
+            }
         lis = list(idx.cat.categories)
         if lis and isinstance(lis[0], pd._libs.tslibs.timestamps.Timestamp):
             lis = [ts.to_pydatetime().astimezone(datetime.timezone.utc) for ts in lis]
         return {"codec": lis, "name": ser.name, "keys": list(idx.cat.codes)}
 
+    @staticmethod
+    def from_field(field, **kwargs):
+        """return a pd.Series from decoded field data (name, type, codec, keys).
+
+        *Parameters*
+
+        - **field**: tuple - name, type, codec (list of json values) and keys
+        - **kwargs**: `to_series` parameters
+
+        The categorical dtype of a codec with keys is stored in the codec cache
+        (`pandas_ntv_codec` module), the codec is decoded once."""
+        ntv_name, typ, codec, keys = field
+        cache_key = None
+        if keys and CODEC_CACHE.maxsize:
+            option = {"alias": False, "annotated": False} | kwargs
+            cache_key = CodecCache.key(typ, option["alias"], option["annotated"], codec)
+        cached = CODEC_CACHE.get(cache_key[0]) if cache_key else None
+        if cached:
+            ntv_type, cat = cached
+            pd_convert = ntv_type in SeriesConnec.types_ntv
+            return pd.Series(
+                pd.Categorical.from_codes(codes=keys, dtype=cat),
+                name=PdUtil.pd_name(ntv_name, ntv_type, pd_convert)[0],
+                index=kwargs.get("index"),
+            )
+        ntv_codec = Ntv.fast(Ntv.obj_ntv(codec, typ=typ, single=len(codec) == 1))
+        srs = SeriesConnec.to_series(ntv_codec, ntv_name, keys, **kwargs)
+        if cache_key and isinstance(srs.dtype, pd.CategoricalDtype):
+            CODEC_CACHE.put(cache_key[0], (ntv_codec.type_str, srs.dtype), cache_key[1])
+        return srs
+
     @staticmethod
     def to_series(ntv_codec, ntv_name, ntv_keys, **kwargs):
         """return a pd.Series from Field data (codec, name, keys)
@@ -512,13 +933,12 @@ class SeriesConnec(NtvConnector):
             "alias": False,
             "annotated": False,
         } | kwargs
-        types = SeriesConnec.types.set_index("ntv_type")
         astype = SeriesConnec.astype
         leng = option["leng"]
 
         ntv_type = ntv_codec.type_str
         len_unique = leng if len(ntv_codec) == 1 and leng else 1
-        pd_convert = ntv_type in types.index
+        pd_convert = ntv_type in SeriesConnec.types_ntv
 
         pd_name, name_type, dtype = PdUtil.pd_name(ntv_name, ntv_type, pd_convert)
         ntv_obj = PdUtil.ntv_obj(
@@ -560,11 +980,59 @@ class SeriesConnec(NtvConnector):
         - **pd_name**: string - name of the Series including ntv_type
 
         NTVvalue and a ntv_type"""
-        srs = pd.read_json(StringIO(json.dumps(data)), dtype=dtype, typ="series")
+        srs = SeriesConnec._from_values(data, dtype)
+        if srs is None:
+            srs = pd.read_json(StringIO(json_dumps(data)), dtype=dtype, typ="series")
         if pd_name is not None:
             srs = srs.rename(pd_name)
         return PdUtil.convert(ntv_type, srs, tojson=False)
 
+    @staticmethod
+    def _from_values(data, dtype):
+        """return a Series built from Json values with a typed constructor
+        (same result as pd.read_json) or None if the values are not supported.
+
+        *Parameters*
+
+        - **data**: list - Json values to convert in a Series
+        - **dtype**: string - dtype of the Series"""
+        if not data:
+            return None
+        val_types = set(map(type, data))
+        nullable = type(None) in val_types
+        val_types.discard(type(None))
+        num_dtype = dtype in SeriesConnec.astype and dtype != "bool"
+        try:
+            if dtype is None and val_types == {int} and not nullable:
+                values = np.array(data)
+                return pd.Series(values) if values.dtype == "int64" else None
+            if dtype is None and val_types and val_types <= {int, float}:
+                values = np.array(data, dtype="float64")
+                if not nullable and np.all(np.mod(values, 1) == 0):
+                    return None
+                return pd.Series(values)
+            if (
+                num_dtype
+                and val_types
+                and val_types <= ({int} if "int" in dtype else {int, float})
+            ):
+                if nullable:
+                    return pd.Series(data, dtype="float64" if "int" in dtype else dtype)
+                return pd.Series(np.array(data, dtype=dtype))
+            if dtype in (None, "bool") and val_types == {bool} and not nullable:
+                return pd.Series(np.array(data, dtype="bool"))
+            if dtype == "string" and val_types <= {str}:
+                return pd.Series(data, dtype="string")
+            if dtype == "datetime64[ns]" and val_types <= {str}:
+                values = pd.to_datetime(data)
+                # e.g. mixed UTC offsets (object values)
+                return pd.Series(values) if values.dtype.kind == "M" else None
+            if dtype == "timedelta64[ns]" and val_types <= {str}:
+                return pd.Series(pd.to_timedelta(data))
+        except (ValueError, TypeError, OverflowError):
+            return None
+        return None
+
     @staticmethod
     def equals(pdself, pdother):
         """return True if pd.equals is True and names are equal and dtype of categories are equal"""
@@ -586,48 +1054,124 @@ class PdUtil:
     Ntv and pandas
     - **ntv_type**: return NTVtype from name_type and dtype of a Series
     - **convert**: convert Series with external NTVtype
+    - **to_temporal**: convert a Series of ISO 8601 strings into a temporal Series
+    - **temporal_format**: return the ISO 8601 format of the values of a Series
+    - **geo_series**: return a Series with geometries or geojson values converted
     - **ntv_val**: convert a simple Series into NTV json-value
+    - **json_val**: return the Json values of a numeric, boolean or datetime Series
+    - **float_values**: return the float64 values of a numeric Series (shortest repr)
     - **ntv_obj**: return a list of values to convert in a Series
     - **pd_name**: return a tuple with the name of the Series and the type deduced from the name
     - **pd_index**: return a DataFrame with index
     - **unic**: return simple value if the Series contains a single value
+    - **is_constant**: return True if all the values of a Series are equal
+    - **json_field**: return the JSON value of a DataFrame column in a NTV tab
+    - **optimize**: return a Series with the encoding that minimizes the JSON size
+    - **explicit_length**: return True if the optimized field of a Series has a length
+    - **encode_coef**: return the repetition coefficient of an array of codes
+    - **array_field**: return the NTV field of a numeric Series with a numpy array
+    - **array_series**: return a Series from a NTV field with a numpy array
+    - **read_arrays**: convert a NTV field or tab with numpy arrays into pandas data
+    - **list_field**: return a NTV field with a numpy array as a NTV field with a list
+    - **to_cbor**: return the CBOR bytes of a JSON value with numpy arrays
+    - **from_cbor**: return the JSON value (with numpy arrays) of CBOR bytes
+    - **map_series**: apply a function to a list of Series or fields (with a pool of workers)
+    - **row_slice**: return the slice of the rows to read
 
     TableSchema
     - **to_obj_table**: convert json TableSchema data into a DataFrame or a Series
+    - **table_columns**: return the list of values of each field of TableSchema records
+    - **table_series**: return a Series from a list of TableSchema json-values
     - **name_table**: return a list of non index field's names from a json Table
     - **ntvtype_table**: return a list of non index field's ntv_type from a json Table
     - **table_schema**: add 'format' and 'type' keys in a Json TableSchema
     - **table_val**: convert a Series into TableSchema json-value
+    - **table_json**: return the TableSchema json-value of a list of columns
+    - **table_values**: return the list of TableSchema json-values of a Series
     - **ntv_table**: return NTVtype from the TableSchema data
     """
 
     @staticmethod
     def to_obj_table(jsn, **kwargs):
-        """convert json TableSchema data into a DataFrame or a Series"""
-        ntv_type = PdUtil.ntvtype_table(jsn["schema"]["fields"])
-        name = PdUtil.name_table(jsn["schema"]["fields"])
-        pd_name = [
-            PdUtil.pd_name(nam, ntvtyp, table=True)[0]
-            for nam, ntvtyp in zip(name, ntv_type)
-        ]
-        pd_dtype = [
-            PdUtil.pd_name(nam, ntvtyp, table=True)[2]
-            for nam, ntvtyp in zip(name, ntv_type)
-        ]
-        dfr = pd.read_json(StringIO(json.dumps(jsn["data"])), orient="record")
-        dfr = PdUtil.pd_index(dfr)
-        dfr = pd.DataFrame(
-            {
-                col: PdUtil.convert(ntv_type[ind], dfr[col], tojson=False)
-                for ind, col in enumerate(dfr.columns)
-            }
-        )
-        dfr = dfr.astype({col: pd_dtype[ind] for ind, col in enumerate(dfr.columns)})
-        dfr.columns = pd_name
-        if len(dfr.columns) == 1:
+        """convert json TableSchema data into a DataFrame or a Series.
+
+        The columns are built from the records in one pass, the dtype of each
+        column is defined by the schema.
+
+        *Parameters*
+
+        - **jsn** : JSON TableSchema value
+        - **columns** : list (default None) - names of the fields to read in this
+        order (all the fields if None), the result is always a DataFrame (NtvError
+        if a name is not in the schema)
+        - **rows** : slice (default None) - rows to read (all the rows if None)
+        """
+        select, rows = kwargs.get("columns"), kwargs.get("rows")
+        fields = jsn["schema"]["fields"]
+        if select is not None:
+            # same fields, order and error as the NTV tab (see LazyFrame.to_pandas)
+            by_name = {field.get("name"): field for field in fields}
+            for col in select:
+                if col not in by_name:
+                    raise NtvError("the field " + str(col) + " is not in the tab")
+            fields = [by_name[col] for col in select]
+            if "index" in by_name and "index" not in select:
+                fields.insert(0, by_name["index"])
+        names = [field.get("name", None) for field in fields]
+        data = jsn["data"] if rows is None else jsn["data"][rows]
+        columns = PdUtil.table_columns(data, names)
+        index = None if rows is None else pd.RangeIndex(len(jsn["data"]))[rows]
+        pd_names, series = [], []
+        for field, name, values in zip(fields, names, columns):
+            ntv_type = PdUtil.ntv_table(
+                field.get("format", "default"), field.get("type", None)
+            )
+            if name == "index":
+                index = pd.Index(PdUtil.table_series(values, ntv_type, None))
+                continue
+            name = None if name == "values" else name
+            pd_name, _, dtype = PdUtil.pd_name(name, ntv_type, table=True)
+            pd_names.append(pd_name)
+            series.append(PdUtil.table_series(values, ntv_type, dtype, name))
+        dfr = pd.DataFrame(dict(enumerate(series)))
+        dfr.columns = pd_names
+        if index is not None:
+            dfr.index = index
+        if len(dfr.columns) == 1 and select is None:
             return dfr[dfr.columns[0]]
         return dfr
 
+    @staticmethod
+    def table_columns(data, names):
+        """return the list of values of each field from a list of TableSchema
+        records (None if the field is missing)"""
+        try:
+            return [list(map(itemgetter(name), data)) for name in names]
+        except KeyError:
+            return [[rec.get(name) for rec in data] for name in names]
+
+    @staticmethod
+    def table_series(values, ntv_type, dtype, name=None):
+        """return a Series from a list of TableSchema json-values.
+
+        *Parameters*
+
+        - **values** : list of json-values
+        - **ntv_type** : string - NTVtype of the values
+        - **dtype** : string - dtype of the Series (if None, the dtype is inferred)
+        - **name** : string (default None) - name of the Series (used to keep the
+        format of the temporal values)
+        """
+        if ntv_type in TABLE_CONVERT:
+            srs = pd.Series(values, dtype="object", name=name)
+            srs = PdUtil.convert(ntv_type, srs, False)
+            return srs if dtype is None else srs.astype(dtype)
+        try:
+            return pd.Series(values, dtype=dtype)
+        except (TypeError, ValueError):
+            # e.g. missing values in an integer column
+            return pd.Series(values)
+
     @staticmethod
     def decode_ntv_to_val(ntv):
         """return a value from a ntv_field"""
@@ -659,12 +1203,12 @@ class PdUtil:
         """convert 'ntv_type' in 'format' and 'type' keys in a Json TableSchema
         for the field defined by 'name'"""
         ind = [field["name"] for field in schema["fields"]].index(name)
-        tabletype = SeriesConnec.table.set_index("ntv_type").loc[ntv_type]
-        if tabletype["format"] == "default":
+        table_format, table_type = SeriesConnec.table_ntv[ntv_type]
+        if table_format == "default":
             schema["fields"][ind].pop("format", None)
         else:
-            schema["fields"][ind]["format"] = tabletype["format"]
-        schema["fields"][ind]["type"] = tabletype["type"]
+            schema["fields"][ind]["format"] = table_format
+        schema["fields"][ind]["type"] = table_type
         schema["fields"][ind].pop("extDtype", None)
         return schema
 
@@ -678,13 +1222,65 @@ class PdUtil:
         - **ntv_name**: string - name of the Series
         - **srs** : Series to be converted."""
         srs = PdUtil.convert(ntv_type, srs)
-        srs.name = ntv_name
-        tab_val = json.loads(
-            srs.to_json(orient="table", date_format="iso", default_handler=str)
-        )
-        name = "values" if srs.name is None else srs.name
-        tab_val["schema"] = PdUtil.table_schema(tab_val["schema"], name, ntv_type)
-        return tab_val
+        srs = srs.rename("values" if ntv_name is None else ntv_name)
+        return PdUtil.table_json([(srs, ntv_type)], srs.index)
+
+    @staticmethod
+    def table_json(columns, index):
+        """return the TableSchema json-value (same value as `to_json` with 'table'
+        orient and 'iso' date format) built column by column.
+
+        *Parameters*
+
+        - **columns** : list of tuple (converted Series, NTVtype) - columns to export
+        - **index** : pandas Index - index of the columns (primary key)"""
+        schema = pd.io.json.build_table_schema(pd.DataFrame(index=index))
+        names = [field["name"] for field in schema["fields"]]
+        values = [
+            PdUtil.table_values(pd.Series(index.get_level_values(level)))
+            for level in range(index.nlevels)
+        ]
+        fields = []
+        for srs, ntv_type in columns:
+            field = pd.io.json.build_table_schema(srs, index=False, version=False)
+            field = {"fields": field["fields"][-1:]}
+            names.append(field["fields"][0]["name"])
+            fields += PdUtil.table_schema(field, names[-1], ntv_type)["fields"]
+            values.append(PdUtil.table_values(srs))
+        schema["fields"] += fields
+        data = [dict(zip(names, row)) for row in zip(*values)]
+        return {"schema": schema, "data": data}
+
+    @staticmethod
+    def table_values(srs):
+        """return the list of TableSchema json-values of a Series (values of
+        srs.to_json with 'iso' date format but full float precision)"""
+        kind = srs.dtype.kind
+        mask = srs.isna().to_numpy()
+        if srs.dtype.name == "category":
+            codec = PdUtil.table_values(pd.Series(srs.cat.categories))
+            codec = np.array(codec + [None], dtype="object")
+            return codec[srs.cat.codes.to_numpy()].tolist()
+        if kind == "f":
+            values = PdUtil.float_values(srs)
+            mask = ~np.isfinite(values)
+            values = values.tolist()
+        elif kind in "iub" and mask.any():
+            dtype = getattr(srs.dtype, "numpy_dtype", srs.dtype)
+            values = srs.to_numpy(dtype=dtype, na_value=0).tolist()
+        elif kind in "iubM":
+            values = PdUtil.json_val(srs)
+            if kind == "M" and srs.dt.tz is not None:
+                values = [val if val is None else val + "Z" for val in values]
+        elif kind == "O" and pd.api.types.infer_dtype(srs) in ("string", "empty"):
+            values = srs.tolist()
+        else:
+            return json_loads(
+                srs.to_json(orient="values", date_format="iso", default_handler=str)
+            )
+        for ind in np.flatnonzero(mask):
+            values[ind] = None
+        return values
 
     @staticmethod
     def convert(ntv_type, srs, tojson=True):
@@ -697,23 +1293,102 @@ class PdUtil:
         - **tojson** : boolean (default True) - apply to json function"""
         if tojson:
             if ntv_type in ["point", "line", "polygon", "geometry"]:
-                return srs.apply(ShapelyConnec.to_coord)
+                return PdUtil.geo_series(pandas_ntv_geo.to_coords, srs)
             if ntv_type == "geojson":
-                return srs.apply(ShapelyConnec.to_geojson)
+                return PdUtil.geo_series(pandas_ntv_geo.to_geojson, srs)
             if ntv_type == "date":
                 return srs.astype(str)
             return srs
         if ntv_type in ["point", "line", "polygon", "geometry"]:
-            return srs.apply(ShapelyConnec.to_geometry)
+            return PdUtil.geo_series(pandas_ntv_geo.from_coords, srs)
         if ntv_type == "geojson":
-            return srs.apply(ShapelyConnec.from_geojson)
+            return PdUtil.geo_series(pandas_ntv_geo.from_geojson, srs)
+        if ntv_type in ["datetime", "date", "time"]:
+            return PdUtil.to_temporal(ntv_type, srs)
+        return srs
+
+    @staticmethod
+    def to_temporal(ntv_type, srs):
+        """convert a Series of ISO 8601 strings into a 'datetime', 'date' or 'time' Series.
+
+        The values are parsed with the format detected on a sample (the format is
+        kept for the next Series with the same name and NTVtype). Otherwise the
+        values are parsed by pd.to_datetime (with 'mixed' format for 'time').
+
+        *Parameters*
+
+        - **ntv_type** : string - 'datetime', 'date' or 'time',
+        - **srs** : Series to be converted."""
+        key = (ntv_type, srs.name)
+        fmt = TEMPORAL_FORMATS.get(key)
+        for detect in ([False] if fmt else []) + [True]:
+            if detect:
+                fmt = PdUtil.temporal_format(ntv_type, srs)
+            if fmt is None:
+                continue
+            try:
+                temporal = PdUtil._parse_temporal(ntv_type, srs, fmt)
+            except (ValueError, TypeError):
+                continue
+            if len(TEMPORAL_FORMATS) >= TEMPORAL_CACHE_SIZE:
+                TEMPORAL_FORMATS.clear()
+            TEMPORAL_FORMATS[key] = fmt
+            return temporal
+        TEMPORAL_FORMATS.pop(key, None)
         if ntv_type == "datetime":
             return pd.to_datetime(srs)
         if ntv_type == "date":
             return pd.to_datetime(srs).dt.date
-        if ntv_type == "time":
-            return pd.to_datetime(srs, format="mixed").dt.time
-        return srs
+        return pd.to_datetime(srs, format="mixed").dt.time
+
+    @staticmethod
+    def temporal_format(ntv_type, srs, sample=TEMPORAL_SAMPLE):
+        """return the ISO 8601 format of the first 'sample' non-null values of a
+        Series (None if the values don't have the same format)"""
+        if srs.dtype != "object":
+            return None
+        formats = {
+            PdUtil._iso_format(ntv_type, value) for value in srs.iloc[:sample].dropna()
+        }
+        return formats.pop() if len(formats) == 1 else None
+
+    @staticmethod
+    def _iso_format(ntv_type, value):
+        """return the ISO 8601 format of a temporal string (None if not ISO 8601)"""
+        pattern, fmt = (
+            (ISO_TIME, "%H:%M") if ntv_type == "time" else (ISO_DATETIME, "%Y-%m-%d")
+        )
+        match = pattern.fullmatch(value) if isinstance(value, str) else None
+        if match is None:
+            return None
+        groups = match.groupdict(default="")
+        if groups.get("sep"):
+            fmt += groups["sep"] + "%H:%M"
+        fmt += (":%S" if groups["sec"] else "") + (".%f" if groups["frac"] else "")
+        return fmt + ("%z" if groups.get("zone") else "")
+
+    @staticmethod
+    def _parse_temporal(ntv_type, srs, fmt):
+        """return the temporal Series of ISO 8601 strings with a fixed format
+        (ValueError or TypeError if a value doesn't have the format)"""
+        if ntv_type == "datetime":
+            return pd.to_datetime(srs, format=fmt)
+        if ntv_type == "date":
+            return pd.to_datetime(srs, format=fmt).dt.date
+        # time.fromisoformat is faster than the format parsing
+        isna = srs.isna().to_numpy()
+        times = [
+            pd.NaT if na else datetime.time.fromisoformat(value)
+            for value, na in zip(srs.to_numpy(), isna)
+        ]
+        if any(not na and time.tzinfo for time, na in zip(times, isna)):
+            raise ValueError("the time values include a time zone")
+        return pd.Series(times, index=srs.index, name=srs.name, dtype="object")
+
+    @staticmethod
+    def geo_series(func, srs):
+        """return a Series with the values converted by a `pandas_ntv_geo` function"""
+        return pd.Series(func(srs.to_numpy()), index=srs.index, name=srs.name)
 
     @staticmethod
     def ntv_type(name_type, dtype, table=False):
@@ -726,13 +1401,11 @@ class PdUtil:
         - **table** : boolean (default False) - True if Table Schema conversion
         """
         if not name_type:
-            types_none = SeriesConnec.types.set_index("name_type").loc[None]
-            if dtype in types_none.dtype.values:
-                return types_none.set_index("dtype").loc[dtype].ntv_type
+            if dtype in SeriesConnec.types_dtype:
+                return SeriesConnec.types_dtype[dtype]
             if not table:
                 return None
-            typtab = SeriesConnec.typtab.set_index("name_type").loc[None]
-            return typtab.set_index("dtype").loc[dtype.lower()].ntv_type
+            return SeriesConnec.typtab_dtype[dtype.lower()]
         return name_type
 
     @staticmethod
@@ -748,10 +1421,61 @@ class PdUtil:
             return srs.to_list()
         if srs.dtype.name == "object":
             return srs.to_list()
-        return json.loads(
+        json_val = PdUtil.json_val(srs)
+        if json_val is not None:
+            return json_val
+        return json_loads(
             srs.to_json(orient="records", date_format="iso", default_handler=str)
         )
 
+    @staticmethod
+    def json_val(srs):
+        """return the list of Json values of a numeric, boolean or datetime Series
+        (values of srs.to_json with 'iso' date format but full float precision,
+        see `PdUtil.float_values`)
+        or None if the dtype is not supported.
+
+        *Parameters*
+
+        - **srs** : Series to be converted."""
+        kind = srs.dtype.kind
+        if kind not in "iufbM":
+            return None
+        mask = srs.isna().to_numpy()
+        if kind == "M":
+            if srs.dt.tz is not None:
+                srs = srs.dt.tz_convert(None)
+            dates = srs.to_numpy()
+            values = []
+            for start in range(0, len(dates), 2**16):
+                values += np.datetime_as_string(
+                    dates[start : start + 2**16], unit="ms"
+                ).tolist()
+        elif kind == "b":
+            values = srs.to_numpy(dtype="bool", na_value=False).tolist()
+        elif kind == "f" or mask.any():
+            values = PdUtil.float_values(srs)
+            mask = ~np.isfinite(values)
+            values = values.tolist()
+        else:
+            values = srs.to_numpy(dtype=getattr(srs.dtype, "numpy_dtype", srs.dtype))
+            values = values.tolist()
+        for ind in np.flatnonzero(mask):
+            values[ind] = None
+        return values
+
+    @staticmethod
+    def float_values(srs):
+        """return the float64 array of the values of a numeric Series (NaN if
+        missing), the values of a float32 or float16 Series are the shortest
+        repr of the values (e.g. 0.1 and not 0.10000000149011612)"""
+        dtype = getattr(srs.dtype, "numpy_dtype", srs.dtype)
+        if dtype.kind == "f" and dtype.itemsize < 8:
+            return (
+                srs.to_numpy(dtype=dtype, na_value=np.nan).astype(str).astype("float64")
+            )
+        return srs.to_numpy(dtype="float64", na_value=np.nan)
+
     @staticmethod
     def ntv_obj(ntv_codec, name_type, annotated, pd_convert):
         """return a list of values to convert in a Series"""
@@ -775,11 +1499,7 @@ class PdUtil:
 
         - **table_format** : string - TableSchema format,
         - **table_type** : string - TableSchema type"""
-        return (
-            SeriesConnec.table.set_index(["type", "format"])
-            .loc[(table_type, table_format)]
-            .values[0]
-        )
+        return SeriesConnec.table_type[(table_type, table_format)]
 
     @staticmethod
     def pd_index(dfr):
@@ -794,14 +1514,11 @@ class PdUtil:
         """return a tuple with the name of the Series, the type deduced from
         the name and the dtype"""
         ntv_name = "" if ntv_name is None else ntv_name
-        typtab = SeriesConnec.typtab.set_index("ntv_type")
-        types = SeriesConnec.types.set_index("ntv_type")
-        if table and ntv_type.lower() in typtab.index:
-            name_type = typtab.loc[ntv_type.lower()]["name_type"]
-            dtype = typtab.loc[ntv_type.lower()]["dtype"]
+        if table and ntv_type.lower() in SeriesConnec.typtab_ntv:
+            name_type, dtype = SeriesConnec.typtab_ntv[ntv_type.lower()]
         elif pd_convert or table:
-            name_type = types.loc[ntv_type]["name_type"] if ntv_type != "" else ""
-            dtype = types.loc[ntv_type]["dtype"]
+            name_type, dtype = SeriesConnec.types_ntv[ntv_type]
+            name_type = name_type if ntv_type != "" else ""
         else:
             return (ntv_name + "::" + ntv_type, ntv_type, "object")
         dtype = SeriesConnec.deftype.get(dtype, dtype)  # ajout
@@ -813,6 +1530,287 @@ class PdUtil:
         """return simple value if the Series contains a single value"""
         if str(srs.dtype) == "category":
             return srs
-        return (
-            srs[:1] if np.array_equal(srs.values, [srs.values[0]] * len(srs)) else srs
+        return srs[:1] if PdUtil.is_constant(srs) else srs
+
+    @staticmethod
+    def is_constant(srs, block=64):
+        """return True if all the values of a Series are equal (the missing values
+        are equal), False if the Series is empty or includes arrays.
+
+        The values are compared by blocks of increasing size (the comparison stops
+        at the first block with a different value)."""
+        values = srs.to_numpy() if isinstance(srs.dtype, np.dtype) else srs.array
+        if not len(values) or isinstance(values[0], (list, tuple, np.ndarray)):
+            return False
+        first = values[0]
+        first_na = pd.isna(first)
+        start = 0
+        while start < len(values):
+            chunk = values[start : start + block]
+            isna = pd.isna(chunk)
+            if first_na != isna.all() or (not first_na and isna.any()):
+                return False
+            try:
+                if not first_na and not (chunk == first).all():
+                    return False
+            except (TypeError, ValueError):
+                return False
+            start += block
+            block *= 4
+        return True
+
+    @staticmethod
+    def json_field(srs, optimize=False, binary=False, coef=True):
+        """return the JSON value of a DataFrame column in a NTV tab (with the
+        smallest encoding if optimize, with numpy arrays if binary, see
+        `PdUtil.optimize` for coef)"""
+        srs = PdUtil.unic(srs)
+        if optimize and len(srs) > 1:
+            srs = PdUtil.optimize(srs, coef=coef)
+        jsn = PdUtil.array_field(srs, tab=True) if binary else None
+        if jsn is not None:
+            return jsn
+        jsn = SeriesConnec.to_json_ntv(srs)[0]
+        if srs.dtype.name == "category":
+            # the categorical JSON value is already in the NTV tab format
+            return jsn
+        return Ntv.from_obj(jsn).to_obj()
+
+    @staticmethod
+    def array_field(srs, tab=False):
+        """return the NTV field of a numeric Series with a numpy array as value
+        (None if the dtype has no CBOR typed array or if the length is < 2).
+
+        *Parameters*
+
+        - **srs** : Series to convert
+        - **tab** : boolean (default False) - if True return the field of a NTV tab
+        """
+        if not isinstance(srs.dtype, np.dtype) or len(srs) < 2:
+            return None
+        dtype = srs.dtype.newbyteorder("<")
+        if dtype.str not in TYPED_ARRAYS:
+            return None
+        # the name of the field is the name of the JSON field
+        jsn = SeriesConnec.to_json_ntv(srs[:2])[0]
+        jsn = Ntv.from_obj(jsn).to_obj() if tab else jsn
+        values = srs.to_numpy(dtype=dtype)
+        return {next(iter(jsn)): values} if isinstance(jsn, dict) else values
+
+    @staticmethod
+    def array_series(field):
+        """return a Series from a NTV field with a numpy array as value (None if
+        the value is not a numpy array)"""
+        if isinstance(field, dict) and len(field) == 1:
+            key, values = next(iter(field.items()))
+        else:
+            key, values = None, field
+        if not isinstance(values, np.ndarray):
+            return None
+        ntv_name, ntv_type = NtvUtil.from_obj_name(key)[:2] if key else (None, None)
+        name = PdUtil.pd_name(ntv_name, ntv_type or "")[0]
+        return pd.Series(values, name=name)
+
+    @staticmethod
+    def read_arrays(jso, **kwargs):
+        """convert a NTV field or a NTV tab including numpy arrays into a Series
+        or a DataFrame (None if there is no numpy array).
+
+        *Parameters*
+
+        - **jso** : JSON value with numpy arrays (see `PdUtil.array_field`)
+        - **kwargs** : `read_json` parameters
+        """
+        head, value = None, jso
+        if isinstance(jso, dict) and len(jso) == 1:
+            key = next(iter(jso))
+            if NtvUtil.from_obj_name(key)[1] in ("field", "tab"):
+                head, value = NtvUtil.from_obj_name(key)[1], jso[key]
+        if head == "field" or (head is None and kwargs.get("series")):
+            return PdUtil.array_series(value)
+        if isinstance(value, dict):
+            fields = [{key: val} for key, val in value.items()]
+        else:
+            fields = value if isinstance(value, list) else [value]
+        arrays = {ind: PdUtil.array_series(field) for ind, field in enumerate(fields)}
+        arrays = {ind: srs for ind, srs in arrays.items() if srs is not None}
+        if not arrays:
+            return None
+        others = [field for ind, field in enumerate(fields) if ind not in arrays]
+        if others:
+            lidx = [
+                list(NtvUtil.decode_ntv_tab(ntvf, PdUtil.decode_ntv_to_val))
+                for ntvf in Ntv.fast(others)
+            ]
+            if any(lind[3] is not None for lind in lidx):
+                # the parent of a field is its position in the tab: the numpy
+                # arrays are converted into lists and all the fields are decoded
+                tab = [
+                    PdUtil.list_field(field) if ind in arrays else field
+                    for ind, field in enumerate(fields)
+                ]
+                return DataFrameConnec.to_obj_ntv(tab, **kwargs)
+            leng = len(next(iter(arrays.values())))
+            others = iter(
+                DataFrameConnec.iter_series(lidx, **(kwargs | {"leng": leng}))
+            )
+        series = [
+            arrays[ind] if ind in arrays else next(others) for ind in range(len(fields))
+        ]
+        return PdUtil.pd_index(pd.DataFrame({srs.name: srs for srs in series}))
+
+    @staticmethod
+    def list_field(field):
+        """return a NTV field with a numpy array as a NTV field with a list"""
+        if isinstance(field, dict):
+            return {key: val.tolist() for key, val in field.items()}
+        return field.tolist()
+
+    @staticmethod
+    def to_cbor(jsn):
+        """return the CBOR bytes of a JSON value (the numpy arrays are encoded
+        as CBOR typed arrays)"""
+        import cbor2
+
+        def default(encoder, value):
+            if not isinstance(value, np.ndarray):
+                raise cbor2.CBOREncodeTypeError("cannot encode " + str(type(value)))
+            tag = TYPED_ARRAYS[value.dtype.newbyteorder("<").str]
+            data = value.astype(value.dtype.newbyteorder("<"), copy=False).tobytes()
+            encoder.encode(cbor2.CBORTag(tag, data))
+
+        return cbor2.dumps(jsn, default=default)
+
+    @staticmethod
+    def from_cbor(data):
+        """return the JSON value of CBOR bytes (the CBOR typed arrays are decoded
+        as numpy arrays)"""
+        import cbor2
+
+        dtypes = {tag: np.dtype(dtype) for dtype, tag in TYPED_ARRAYS.items()}
+
+        def tag_hook(*args):
+            # (decoder, tag) with cbor2 < 6, (tag, immutable) with cbor2 >= 6
+            tag = next(arg for arg in args if isinstance(arg, cbor2.CBORTag))
+            if tag.tag not in dtypes:
+                return tag
+            values = np.frombuffer(tag.value, dtype=dtypes[tag.tag])
+            return values.astype(values.dtype.newbyteorder("="))
+
+        return cbor2.loads(data, tag_hook=tag_hook)
+
+    @staticmethod
+    def optimize(srs, coef=True):
+        """return the Series or the categorical Series if the codec+keys (or
+        'coef') encoding is smaller than the full encoding.
+
+        The categories are in order of appearance (a periodic Series is encoded
+        with 'coef' whatever the order of its values). The sizes are estimated
+        from the length of the text of the categories and of the codes.
+
+        *Parameters*
+
+        - **srs** : Series to encode
+        - **coef** : boolean (default True) - if False, the periodic Series are
+        not converted (the length of a 'coef' field is defined only in a tab)
+        """
+        if srs.dtype.name == "category" or len(srs) < 2:
+            return srs
+        try:
+            codes, cdc = pd.factorize(srs)
+        except (TypeError, ValueError):
+            return srs
+        if len(cdc) == len(srs):
+            return srs
+        cdc = pd.Index(cdc)
+        quote = 2 if cdc.dtype.kind in "OUSMm" else 0
+        sizes = cdc.astype(str).str.len().to_numpy() + quote + 2
+        nulls = np.count_nonzero(codes < 0)
+        full = np.bincount(codes[codes >= 0], minlength=len(cdc)) @ sizes + 6 * nulls
+        period = PdUtil.encode_coef(codes)
+        if period and not coef and period * len(cdc) != len(codes):
+            return srs
+        if period:
+            keys = len(str(period))
+        else:
+            digits = np.log10(np.maximum(codes, 1)).astype("int64") + 1
+            keys = int(digits.sum()) + nulls + 2 * len(codes)
+        if sizes.sum() + keys + 8 >= full:
+            return srs
+        return pd.Series(
+            pd.Categorical.from_codes(codes, cdc), index=srs.index, name=srs.name
         )
+
+    @staticmethod
+    def explicit_length(srs):
+        """return True if the field of a Series optimized in a NTV tab defines the
+        length of the tab (full or codec+keys encoding, 'coef' encoding with
+        all the periods).
+
+        The 'coef' encoding is allowed in a NTV tab only if a field has an explicit
+        length (see `PdUtil.optimize`)."""
+        srs = PdUtil.unic(srs)
+        if len(srs) < 2:
+            return False
+        if srs.dtype.name == "category":
+            codes, leng_codec = srs.cat.codes.to_numpy(), len(srs.cat.categories)
+        else:
+            try:
+                codes, cdc = pd.factorize(srs)
+            except (TypeError, ValueError):
+                return True
+            leng_codec = len(cdc)
+        coef = PdUtil.encode_coef(codes)
+        return not coef or coef * leng_codec == len(codes)
+
+    @staticmethod
+    def encode_coef(codes):
+        """return the repetition coefficient of a periodic array of codes (0 if
+        the codes are not periodic), see `NtvConnector.encode_coef`"""
+        if len(codes) < 2:
+            return 0
+        changes = np.flatnonzero(codes[1:] != codes[:-1])
+        coef = int(changes[0]) + 1 if len(changes) else len(codes)
+        period = int(codes.max()) + 1
+        if period < 1 or len(codes) % (coef * period):
+            return 0
+        keys = np.arange(len(codes)) % (coef * period) // coef
+        return coef if np.array_equal(codes, keys) else 0
+
+    @staticmethod
+    def map_series(func, series, workers=None, executor="thread"):
+        """return the list of func(srs) for each Series (or field data) of a list.
+
+        *Parameters*
+
+        - **func** : function - function to apply (module level function or static
+        method with a 'process' executor)
+        - **series** : list of Series or of field data
+        - **workers** : integer (default None) - if not None, number of workers
+        used to apply the function concurrently
+        - **executor** : string (default 'thread') - pool of workers ('thread' or 'process')
+        """
+        if not workers or len(series) < 2:
+            return [func(srs) for srs in series]
+        if executor not in ("thread", "process"):
+            raise NtvError("executor is not 'thread' or 'process'")
+        pool = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+        with pool(max_workers=min(workers, len(series))) as exe:
+            return list(exe.map(func, series))
+
+    @staticmethod
+    def row_slice(rows=None, nrows=None):
+        """return the slice of the rows to read (None if all the rows are read).
+
+        *Parameters*
+
+        - **rows** : slice (default None) - rows to read
+        - **nrows** : integer (default None) - number of rows to read from the first row
+        """
+        if rows is not None and not isinstance(rows, slice):
+            raise NtvError("rows is not a slice")
+        if nrows is None:
+            return rows
+        if rows is not None:
+            raise NtvError("rows and nrows can't be used together")
+        return slice(nrows)
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: philippe@loco-labs.io
+
+The `pandas_ntv_geo` module is part of the `ntv-pandas.ntv_pandas` package
+([specification document](
+https://loco-philippe.github.io/ES/JSON%20semantic%20format%20(JSON-NTV).htm)).
+
+It contains the conversion functions between the shapely geometries of a
+Series and their JSON values (used by `PdUtil.convert`):
+
+- function `to_coords`: return the geojson coordinates of the geometries
+- function `to_geojson`: return the geojson strings of the geometries
+- function `from_coords`: return the geometries of geojson coordinates
+- function `from_geojson`: return the geometries of geojson strings
+
+The points, lines and polygons (2D, not empty) are converted with the shapely 2
+array functions, the other values are converted one by one with `ShapelyConnec`
+(the JSON values are identical).
+"""
+
+import json
+import numpy as np
+import shapely
+
+from json_ntv.ntv_connector import ShapelyConnec
+
+GEO_TYPE_ID = {"point": 0, "line": 1, "polygon": 3}
+"""shapely type id of the geometries converted with the array functions"""
+
+GEOJSON_TYPE = {0: "Point", 1: "LineString", 3: "Polygon"}
+"""geojson type of the shapely type id"""
+
+
+def to_coords(values):
+    """return the list of geojson coordinates of an array of geometries"""
+    return _encode(np.asarray(values, dtype="object"), False)
+
+
+def to_geojson(values):
+    """return the list of geojson strings of an array of geometries"""
+    return _encode(np.asarray(values, dtype="object"), True)
+
+
+def from_coords(values):
+    """return the list of geometries of a list of geojson coordinates"""
+    values = list(values)
+    geo = [None] * len(values)
+    kinds = [ShapelyConnec.type_geo(value) for value in values]
+    for kind in GEO_TYPE_ID:
+        rows = [row for row, knd in enumerate(kinds) if knd == kind]
+        if not rows:
+            continue
+        try:
+            geoms = _DECODERS[kind]([values[row] for row in rows])
+        except (ValueError, TypeError, shapely.errors.GEOSException):
+            continue
+        for row, geom in zip(rows, geoms):
+            geo[row] = geom
+            kinds[row] = None
+    for row, kind in enumerate(kinds):
+        if kind is not None:
+            geo[row] = ShapelyConnec.to_geometry(values[row])
+    return geo
+
+
+def from_geojson(values):
+    """return the list of geometries of a list of geojson strings"""
+    values = list(values)
+    try:
+        return list(shapely.from_geojson(np.array(values, dtype="object")))
+    except (ValueError, TypeError, shapely.errors.GEOSException):
+        return [ShapelyConnec.from_geojson(value) for value in values]
+
+
+def _encode(geoms, geojson):
+    """return the list of geojson coordinates (or strings) of an array of geometries"""
+    try:
+        type_id = shapely.get_type_id(geoms)
+        vector = ~(shapely.is_empty(geoms) | shapely.has_z(geoms))
+    except TypeError:
+        type_id = np.full(len(geoms), -1)
+        vector = np.zeros(len(geoms), dtype=bool)
+    jsn = [None] * len(geoms)
+    for tid, encoder in _ENCODERS.items():
+        rows = np.flatnonzero(vector & (type_id == tid))
+        if not len(rows):
+            continue
+        coords = encoder(geoms[rows])
+        if geojson:
+            head = '{"type": "' + GEOJSON_TYPE[tid] + '", "coordinates": '
+            coords = [head + json.dumps(coord) + "}" for coord in coords]
+        for row, coord in zip(rows.tolist(), coords):
+            jsn[row] = coord
+    for row in np.flatnonzero(~vector | ~np.isin(type_id, list(_ENCODERS))).tolist():
+        geom = geoms[row]
+        jsn[row] = (
+            ShapelyConnec.to_geojson(geom) if geojson else ShapelyConnec.to_coord(geom)
+        )
+    return jsn
+
+
+def _split(items, counts):
+    """return the list of slices of items defined by the counts"""
+    ends = np.cumsum(counts).tolist()
+    return [items[start:end] for start, end in zip([0] + ends[:-1], ends)]
+
+
+def _points_coords(geoms):
+    """return the coordinates of an array of points"""
+    return shapely.get_coordinates(geoms).tolist()
+
+
+def _lines_coords(geoms):
+    """return the coordinates of an array of lines"""
+    coords = shapely.get_coordinates(geoms).tolist()
+    return _split(coords, shapely.get_num_coordinates(geoms))
+
+
+def _polygons_coords(geoms):
+    """return the coordinates (list of rings) of an array of polygons"""
+    rings = shapely.get_rings(geoms)
+    coords = _split(
+        shapely.get_coordinates(rings).tolist(), shapely.get_num_coordinates(rings)
+    )
+    return _split(coords, shapely.get_num_interior_rings(geoms) + 1)
+
+
+def _points(values):
+    """return the points of a list of coordinates"""
+    return shapely.points(_coords(values, 0))
+
+
+def _lines(values):
+    """return the lines of a list of coordinates"""
+    indices = np.repeat(np.arange(len(values)), [len(val) for val in values])
+    return shapely.linestrings(_coords(values, 1), indices=indices)
+
+
+def _polygons(values):
+    """return the polygons of a list of coordinates (list of rings)"""
+    rings = [ring for val in values for ring in val]
+    ring_ind = np.repeat(np.arange(len(rings)), [len(ring) for ring in rings])
+    poly_ind = np.repeat(np.arange(len(values)), [len(val) for val in values])
+    lrings = shapely.linearrings(_coords(values, 2), indices=ring_ind)
+    return shapely.polygons(lrings, indices=poly_ind)
+
+
+def _coords(values, depth):
+    """return the 2D array of the coordinates nested at the depth"""
+    for _ in range(depth):
+        values = [item for val in values for item in val]
+    coords = np.array(values, dtype="float64")
+    if coords.ndim != 2 or coords.shape[1] != 2:
+        raise ValueError("the coordinates are not 2D points")
+    return coords
+
+
+_ENCODERS = {0: _points_coords, 1: _lines_coords, 3: _polygons_coords}
+_DECODERS = {"point": _points, "line": _lines, "polygon": _polygons}
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: philippe@loco-labs.io
+
+The `pandas_ntv_json` module is part of the `ntv-pandas.ntv_pandas` package
+([specification document](
+https://loco-philippe.github.io/ES/JSON%20semantic%20format%20(JSON-NTV).htm)).
+
+It contains the JSON backend used to encode and decode JSON text in the
+`ntv_pandas` modules:
+
+- functions `set_json_backend` and `get_json_backend` to select the backend
+('json' (standard library, default), 'orjson' or 'ujson' if installed)
+- functions `json_dumps` and `json_loads` called instead of `json.dumps` and
+`json.loads`
+- function `json_separators` to write JSON text with the separators of the backend
+
+The numpy values (scalars and arrays) and the datetime values are encoded by
+all the backends (natively with orjson).
+"""
+
+import json
+import datetime
+from functools import partial
+import numpy as np
+
+from json_ntv.ntv_util import NtvError
+
+
+def _default(value):
+    """return a JSON value for the numpy and datetime values"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    raise TypeError(
+        "Object of type " + type(value).__name__ + " is not JSON serializable"
+    )
+
+
+def _stdlib():
+    """return the dumps and loads functions and the separators of the json package"""
+    return (partial(json.dumps, default=_default), json.loads, (", ", ": "))
+
+
+def _orjson():
+    """return the dumps and loads functions and the separators of the orjson package"""
+    import orjson
+
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(value):
+        return orjson.dumps(value, default=_default, option=option).decode("utf-8")
+
+    return (dumps, orjson.loads, (",", ":"))
+
+
+def _ujson():
+    """return the dumps and loads functions and the separators of the ujson package"""
+    import ujson
+
+    dumps = partial(
+        ujson.dumps,
+        default=_default,
+        ensure_ascii=False,
+        escape_forward_slashes=False,
+    )
+    return (dumps, ujson.loads, (",", ":"))
+
+
+JSON_BACKENDS = {"json": _stdlib, "orjson": _orjson, "ujson": _ujson}
+"""functions returning the dumps and loads functions and the separators (item, key)
+of each JSON backend"""
+
+_BACKEND = dict(zip(("dumps", "loads", "separators"), _stdlib())) | {"name": "json"}
+
+
+def set_json_backend(name="json"):
+    """select the JSON backend used by the ntv_pandas functions.
+
+    *Parameters*
+
+    - **name** : string (default 'json') - 'json' (standard library), 'orjson' or
+    'ujson' (the package has to be installed)
+    """
+    if name not in JSON_BACKENDS:
+        raise NtvError("the JSON backend " + str(name) + " is not available")
+    try:
+        dumps, loads, separators = JSON_BACKENDS[name]()
+    except ImportError as err:
+        raise NtvError("the package " + name + " is not installed") from err
+    _BACKEND.update(
+        {"name": name, "dumps": dumps, "loads": loads, "separators": separators}
+    )
+
+
+def get_json_backend():
+    """return the name of the JSON backend used by the ntv_pandas functions"""
+    return _BACKEND["name"]
+
+
+def json_dumps(value):
+    """return the JSON text of a JSON value (with the selected backend)"""
+    return _BACKEND["dumps"](value)
+
+
+def json_loads(text):
+    """return the JSON value of a JSON text (with the selected backend)"""
+    return _BACKEND["loads"](text)
+
+
+def json_separators():
+    """return the item and key separators of the JSON text (selected backend)"""
+    return _BACKEND["separators"]
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: philippe@loco-labs.io
+
+The `pandas_ntv_lazy` module is part of the `ntv-pandas.ntv_pandas` package
+([specification document](
+https://loco-philippe.github.io/ES/JSON%20semantic%20format%20(JSON-NTV).htm)).
+
+It contains the class `LazyFrame`: lazy DataFrame view of a NTV tab (returned
+by `read_json` with `lazy=True`), the Series of a field is generated on first
+access.
+"""
+
+import numpy as np
+import pandas as pd
+
+from json_ntv.ntv import Ntv, NtvConnector
+from json_ntv.ntv_util import NtvUtil, NtvError
+from ntv_pandas.pandas_ntv_connector import SeriesConnec, PdUtil
+
+
+class LazyFrame:
+    """Lazy DataFrame view of a NTV tab.
+
+    The fields are kept as JSON values. A field is decoded (`NtvUtil.decode_ntv_tab`)
+    and its Series is generated on first access. The keys of a derived or coupled
+    field are resolved with the keys of its parent field (the parent field is
+    decoded but its Series is not generated).
+
+    *Attributes :*
+
+    - **fields** : list - JSON value of each field
+    - **keys** : list - JSON key of each field (None if the field has no name)
+    - **names** : list - NTV name of each field (None if the field has no name)
+    - **lidx** : list - decoded data of each field (`NtvUtil.decode_ntv_tab` list)
+    or None if the field is not decoded
+    - **option** : dict - `read_json` parameters used to generate the Series
+
+    The methods defined in this class are :
+
+    - `from_json` (static method): return a LazyFrame from the JSON value of a NTV tab
+    - `length` (property): length of the tab
+    - `decoded` (property): names of the fields with a generated Series
+    - `series`: return the Series of a field
+    - `to_pandas`: return a DataFrame with the selected fields
+    """
+
+    def __init__(self, fields, **kwargs):
+        """LazyFrame constructor.
+
+        *Parameters*
+
+        - **fields** : list - JSON value of each field of the NTV tab
+        - **kwargs** : `read_json` parameters used to generate the Series
+        ('workers' and 'executor' are ignored)
+        """
+        self.fields = list(fields)
+        self.keys = [LazyFrame._key(field) for field in self.fields]
+        self.names = [
+            None if key is None else NtvUtil.from_obj_name(key)[0] for key in self.keys
+        ]
+        self.lidx = [None] * len(self.fields)
+        self.option = {
+            key: val
+            for key, val in kwargs.items()
+            if key not in ("workers", "executor", "lazy", "columns", "rows", "nrows")
+        }
+        self._no_keys = [None] * len(self.fields)
+        self._series = {}
+        self._min_leng = self.option.pop("leng", None) or 0
+        self._length = None
+
+    def __len__(self):
+        """length of the tab"""
+        return self.length
+
+    def __getitem__(self, selec):
+        """return the Series of a field (name or position) or a DataFrame
+        (list of fields)"""
+        if isinstance(selec, list):
+            return self.to_pandas(selec)
+        return self.series(selec)
+
+    def __repr__(self):
+        """return the class name and the names of the fields"""
+        return self.__class__.__name__ + str(self.names)
+
+    @staticmethod
+    def from_json(jso, **kwargs):
+        """return a LazyFrame from the JSON value of a NTV tab (with or without
+        the ':tab' header).
+
+        *Parameters*
+
+        - **jso** : JSON value to convert
+        - **kwargs** : `read_json` parameters used to generate the Series
+        """
+        value = jso
+        if isinstance(jso, dict) and "schema" in jso:
+            raise NtvError("the JSON value is a TableSchema and not a NTV tab")
+        if isinstance(jso, dict) and len(jso) == 1:
+            key = next(iter(jso))
+            head = NtvUtil.from_obj_name(key)[1]
+            if head == "field":
+                raise NtvError("the JSON value is a NTV field and not a NTV tab")
+            if head == "tab":
+                value = jso[key]
+        if isinstance(value, dict):
+            return LazyFrame([{key: val} for key, val in value.items()], **kwargs)
+        if isinstance(value, list):
+            return LazyFrame(value, **kwargs)
+        raise NtvError("the JSON value is not a NTV tab")
+
+    @property
+    def length(self):
+        """length of the tab.
+
+        The length is the length of a full field (list with more than 3 values
+        or numpy array) or the 'leng' parameter if greater. If there is no full
+        field, all the fields are decoded."""
+        if self._length is None:
+            lengths = [LazyFrame._full_length(field) for field in self.fields]
+            if not any(lengths):
+                lengths = [self._decode(ind)[6] for ind in range(len(self.fields))]
+            self._length = max(lengths + [self._min_leng])
+        return self._length
+
+    @property
+    def decoded(self):
+        """return the names of the fields with a generated Series"""
+        return [self.names[ind] for ind in sorted(self._series)]
+
+    def series(self, field, rows=None):
+        """return the Series of a field (generated on first access).
+
+        *Parameters*
+
+        - **field** : string or integer - name, JSON key or position of the field
+        - **rows** : slice (default None) - rows to read (all the rows if None).
+        The keys are sliced before the Series is generated (not stored).
+        """
+        ind = self._index(field)
+        if rows is None:
+            if ind not in self._series:
+                srs = PdUtil.array_series(self.fields[ind])
+                self._series[ind] = self._from_field(ind) if srs is None else srs
+            return self._series[ind]
+        index = pd.RangeIndex(self.length)[rows]
+        if not len(index):
+            # empty keys are not decoded: the first row is generated and removed
+            srs = self.series(ind, slice(1)) if self.length else self.series(ind)
+            return srs[:0].set_axis(index)
+        srs = PdUtil.array_series(self.fields[ind])
+        srs = self._from_field(ind, rows) if srs is None else srs[rows]
+        return srs.set_axis(index)
+
+    def to_pandas(self, columns=None, rows=None):
+        """return a DataFrame with the selected fields (the 'index' field is
+        used as index).
+
+        *Parameters*
+
+        - **columns** : list (default None) - names, JSON keys or positions of the
+        fields (all the fields if None)
+        - **rows** : slice (default None) - rows to read (all the rows if None)
+        """
+        if columns is None:
+            inds = list(range(len(self.fields)))
+        else:
+            inds = [self._index(col) for col in columns]
+            if "index" in self.names and self.names.index("index") not in inds:
+                inds.insert(0, self.names.index("index"))
+        dfr = pd.DataFrame(
+            {srs.name: srs for srs in (self.series(ind, rows) for ind in inds)}
+        )
+        return PdUtil.pd_index(dfr)
+
+    def _index(self, field):
+        """return the position of a field"""
+        if isinstance(field, (int, np.integer)) and 0 <= field < len(self.fields):
+            return int(field)
+        if field in self.names:
+            return self.names.index(field)
+        if field in self.keys:
+            return self.keys.index(field)
+        raise NtvError("the field " + str(field) + " is not in the tab")
+
+    def _decode(self, ind):
+        """decode a field and return the decoded data"""
+        if self.lidx[ind] is None:
+            lind = list(
+                NtvUtil.decode_ntv_tab(
+                    Ntv.fast(self.fields[ind]), PdUtil.decode_ntv_to_val
+                )
+            )
+            self._no_keys[ind] = not lind[3] and not lind[4] and not lind[5]
+            self.lidx[ind] = lind
+        return self.lidx[ind]
+
+    def _from_field(self, ind, rows=None):
+        """return the Series of a field (the parent fields are decoded)"""
+        if rows is not None and self.lidx[ind] is None:
+            field = self._full_field(ind, rows)
+            if field is not None:
+                return self._full_series(field)
+        lind = self._decode(ind)
+        parent = lind[3]
+        while isinstance(parent, int) and self.lidx[parent] is None:
+            parent = self._decode(parent)[3]
+        leng = self.length
+        # see NtvConnector.init_ntv_keys (the keys of a parent can be initialized)
+        if lind[3] is not None or not lind[4] or len(lind[4]) != leng:
+            NtvConnector.init_ntv_keys(ind, self.lidx, leng)
+        codec, keys = lind[2], None if self._no_keys[ind] else lind[4]
+        if rows is not None:
+            leng = len(range(leng)[rows])
+            if keys is not None:
+                keys = keys[rows]
+            elif len(codec) > 1:
+                return self._full_series((lind[0], lind[1], codec[rows], None))
+        return SeriesConnec.from_field(
+            (lind[0], lind[1], codec, keys), **(self.option | {"leng": leng})
+        )
+
+    def _full_field(self, ind, rows):
+        """return the field data (name, type, codec, keys) of the selected rows of
+        a full field (None if the field is not a full field).
+
+        The JSON values are sliced before they are decoded."""
+        field = self.fields[ind]
+        if not LazyFrame._full_length(field) or isinstance(field, Ntv):
+            return None
+        key = self.keys[ind]
+        values = (field[key] if key else field)[rows]
+        ntv = Ntv.fast({key: values} if key else values)
+        typ = ntv.type_str if ntv.ntv_type else None
+        return (ntv.name, typ, PdUtil.decode_ntv_to_val(ntv), None)
+
+    def _full_series(self, field):
+        """return the Series of the codec of a full field"""
+        name, typ, codec, keys = field
+        if len(codec) == 1:
+            # a single value is decoded as a unique value (not typed)
+            return SeriesConnec.from_field((name, typ, codec * 2, keys), **self.option)[
+                :1
+            ]
+        return SeriesConnec.from_field(field, **(self.option | {"leng": len(codec)}))
+
+    @staticmethod
+    def _key(field):
+        """return the JSON key of a field"""
+        if isinstance(field, Ntv):
+            key = field.json_name(string=True)
+            return key if key else None
+        if isinstance(field, dict) and len(field) == 1:
+            return next(iter(field))
+        return None
+
+    @staticmethod
+    def _full_length(field):
+        """return the length of a full field (0 if the field is not full)"""
+        value = (
+            next(iter(field.values()))
+            if isinstance(field, dict) and len(field) == 1
+            else field
+        )
+        value = value.ntv_value if isinstance(value, Ntv) else value
+        if isinstance(value, np.ndarray) or (
+            isinstance(value, list) and len(value) > 3
+        ):
+            return len(value)
+        return 0
@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: philippe@loco-labs.io
+
+The `pandas_ntv_stream` module is part of the `ntv-pandas.ntv_pandas` package
+([specification document](
+https://loco-philippe.github.io/ES/JSON%20semantic%20format%20(JSON-NTV).htm)).
+
+It contains :
+
+- function `read_json_file` to convert a JSON file into pandas entities with
+bounded memory (the JSON text is parsed incrementally)
+- function `to_json_file` to write the JSON text of pandas entities into a file
+with bounded memory (the JSON text is written column by column)
+- class `JsonStream`: incremental JSON parser of a text stream
+"""
+
+import os
+import io
+import re
+import json
+import codecs
+import tempfile
+from contextlib import contextmanager
+import pandas as pd
+
+from json_ntv.ntv import Ntv
+from json_ntv.ntv_util import NtvUtil, NtvError
+from ntv_pandas.pandas_ntv_connector import DataFrameConnec, PdUtil
+from ntv_pandas.pandas_ntv_connector import read_json, to_json
+from ntv_pandas.pandas_ntv_json import json_dumps, json_separators
+from ntv_pandas.pandas_ntv_cache import read_cache, write_cache
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+NUMBER_CHARS = re.compile(r"[0-9.eE+-]*")
+
+
+def read_json_file(path_or_buf, **kwargs):
+    """convert a JSON file into a pandas Series or DataFrame with bounded memory.
+
+    The JSON text is parsed incrementally:
+
+    - NTV tab ({":tab": {...}}): each field is decoded as soon as it is parsed
+    (the JSON text of the other fields is not kept in memory),
+    - TableSchema ({"schema": ..., "data": [...]}): the records are converted
+    by batch,
+    - other JSON data are converted with `read_json`.
+
+    *parameters*
+
+    - **path_or_buf** : string, Path or file object - JSON file to convert
+    - **iterator** : boolean (default False) - if True, return a generator of Series
+    (NTV tab, the 'index' Series included) or DataFrame (TableSchema batches) or
+    of the single converted object (other JSON data)
+    - **chunksize** : integer (default 10000) - number of records in a TableSchema batch
+    - **buffer_size** : integer (default 2**20) - number of characters read at once
+    - **cache** : string or Path (default None) - if not None, cache folder (see
+    `pandas_ntv_cache`): the decoded columns are stored at the first read and
+    loaded as memory-mapped arrays at the next reads of the file (path_or_buf is
+    a path and iterator is False)
+    - other parameters are the `read_json` parameters ('columns', 'rows' and 'nrows'
+    excepted)
+    """
+    if {"columns", "rows", "nrows"} & kwargs.keys():
+        raise NtvError("columns, rows and nrows are not available with read_json_file")
+    stream_opt = {
+        "iterator": False,
+        "chunksize": 10000,
+        "buffer_size": 2**20,
+        "cache": None,
+    }
+    stream_opt |= {key: kwargs.pop(key) for key in stream_opt if key in kwargs}
+    cache = stream_opt.pop("cache")
+    if cache is None:
+        return _read_json_file(path_or_buf, stream_opt, kwargs)
+    if stream_opt["iterator"] or not isinstance(path_or_buf, (str, os.PathLike)):
+        raise NtvError("the cache is available with a file path and without iterator")
+    pd_array = read_cache(path_or_buf, cache, kwargs)
+    if pd_array is None:
+        pd_array = _read_json_file(path_or_buf, stream_opt, kwargs)
+        write_cache(path_or_buf, cache, kwargs, pd_array)
+    return pd_array
+
+
+def _read_json_file(path_or_buf, stream_opt, option):
+    """convert a JSON file into a pandas Series or DataFrame (see `read_json_file`)"""
+    gen = _iter_json(path_or_buf, stream_opt, option)
+    kind = next(gen)
+    if stream_opt["iterator"]:
+        return gen
+    if kind == "tab":
+        dfr = pd.DataFrame({ser.name: ser for ser in gen})
+        return PdUtil.pd_index(dfr)
+    if kind == "table":
+        batches = list(gen)
+        return batches[0] if len(batches) == 1 else pd.concat(batches)
+    return next(gen)
+
+
+def _iter_json(path_or_buf, stream_opt, option):
+    """generate the kind of the JSON data ('tab', 'table' or 'json') followed by
+    the Series (tab), the DataFrame batches (table) or the converted data (json)"""
+    with _text_stream(path_or_buf) as stream:
+        jsn = JsonStream(stream, stream_opt["buffer_size"])
+        if jsn.peek() != "{":
+            yield "json"
+            yield read_json(jsn.value(), **option)
+            return
+        jsn.expect("{")
+        key = jsn.value() if jsn.peek() == '"' else None
+        if key is not None and NtvUtil.from_obj_name(key)[1] == "tab":
+            jsn.expect(":")
+            lidx = [
+                list(NtvUtil.decode_ntv_tab(Ntv.fast(field), PdUtil.decode_ntv_to_val))
+                for field in jsn.fields()
+            ]
+            jsn.expect("}")
+            yield "tab"
+            yield from DataFrameConnec.iter_series(lidx, **option)
+            return
+        if key == "schema":
+            yield "table"
+            jsn.expect(":")
+            schema, nb_batch = jsn.value(), 0
+            while jsn.expect(",}") == ",":
+                key = jsn.value()
+                jsn.expect(":")
+                if key != "data":
+                    jsn.value()
+                    continue
+                for batch in jsn.records(stream_opt["chunksize"]):
+                    nb_batch += 1
+                    jso = {"schema": schema, "data": batch}
+                    yield PdUtil.to_obj_table(jso, **option)
+            if not nb_batch:
+                yield PdUtil.to_obj_table({"schema": schema, "data": []}, **option)
+            return
+        jso = {}
+        while key is not None:
+            jsn.expect(":")
+            jso[key] = jsn.value()
+            key = jsn.value() if jsn.expect(",}") == "," else None
+        yield "json"
+        yield read_json(jso, **option)
+
+
+def to_json_file(pd_array, path_or_buf, **kwargs):
+    """write the JSON text of a pandas Series or DataFrame into a file with
+    bounded memory.
+
+    The written text is identical to `to_json(pd_array, encoded=True, ...)`:
+
+    - NTV tab: the columns are converted one by one, the JSON text of each
+    column is kept in a temporary file until the tab format (object or array)
+    is known,
+    - TableSchema: the records are converted and written by batch,
+    - Series: the JSON text is written at once.
+
+    *parameters*
+
+    - **pd_array** : Series or Dataframe to convert
+    - **path_or_buf** : string, Path or file object (text or binary) - file to write
+    - **header** : boolean (default: True) - if True the JSON data is included as
+    value in a {key:value} object where key is ':field' for Series or ':tab' for DataFrame
+    - **table** : boolean (default False) - if True write TableSchema format
+    - **index** : boolean (default True) - if True the index Series is included
+    - **chunksize** : integer (default 10000) - number of records in a TableSchema batch
+    - **buffer_size** : integer (default 2**20) - number of characters copied at once
+    - **optimize** : boolean (default False) - if True each column is encoded
+    with the smallest format (full, codec+keys or 'coef', NTV format only)
+    """
+    option = {
+        "header": True,
+        "table": False,
+        "index": True,
+        "chunksize": 10000,
+        "buffer_size": 2**20,
+        "optimize": False,
+    } | kwargs
+    with _text_stream(path_or_buf, "w") as stream:
+        if isinstance(pd_array, pd.Series):
+            jsn = to_json(
+                pd_array,
+                header=option["header"],
+                table=option["table"],
+                optimize=option["optimize"],
+            )
+            stream.write(json_dumps(jsn))
+        elif option["table"]:
+            _write_table(stream, pd_array, option["chunksize"])
+        else:
+            _write_tab(stream, pd_array, option)
+
+
+def _write_tab(stream, dfr, option):
+    """write the NTV tab of a DataFrame column by column"""
+    df2 = dfr.reset_index() if option["index"] else dfr
+    keys, sizes = [], []
+    # see DataFrameConnec.to_json_ntv for the 'coef' encoding
+    coef = option["optimize"] and any(
+        PdUtil.explicit_length(df2[col]) for col in df2.columns
+    )
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as spool:
+        for col in df2.columns:
+            jsn = PdUtil.json_field(df2[col], option["optimize"], coef=coef)
+            keys.append(
+                next(iter(jsn)) if isinstance(jsn, dict) and len(jsn) == 1 else None
+            )
+            sizes.append(spool.write(json_dumps(jsn)))
+            del jsn
+        # see DataFrameConnec.to_json_ntv for the tab format (object or array)
+        dictable = len(sizes) != 1 and None not in keys and len(set(keys)) == len(keys)
+        item, key = json_separators()
+        spool.seek(0)
+        stream.write('{":tab"' + key if option["header"] else "")
+        stream.write("{" if dictable else "[")
+        for ind, size in enumerate(sizes):
+            stream.write(item if ind else "")
+            if dictable:
+                # the field {"name": value} is written as "name": value
+                spool.read(1)
+                size -= 2
+            while size > 0:
+                text = spool.read(min(size, option["buffer_size"]))
+                stream.write(text)
+                size -= len(text)
+            if dictable:
+                spool.read(1)
+        stream.write("}" if dictable else "]")
+        stream.write("}" if option["header"] else "")
+
+
+def _write_table(stream, dfr, chunksize):
+    """write the TableSchema of a DataFrame by batch of records"""
+    item, key = json_separators()
+    for start in range(0, max(len(dfr), 1), chunksize):
+        jsn = DataFrameConnec.to_json_ntv(
+            dfr.iloc[start : start + chunksize], table=True
+        )[0]
+        if not start:
+            schema = json_dumps(jsn["schema"])
+            stream.write('{"schema"' + key + schema + item + '"data"' + key + "[")
+        elif jsn["data"]:
+            stream.write(item)
+        stream.write(item.join(json_dumps(rec) for rec in jsn["data"]))
+    stream.write("]}")
+
+
+@contextmanager
+def _text_stream(path_or_buf, mode="r"):
+    """return a text stream from a path or a (binary or text) file object"""
+    if isinstance(path_or_buf, (str, os.PathLike)):
+        with open(path_or_buf, mode, encoding="utf-8") as file:
+            yield file
+    elif isinstance(path_or_buf, io.TextIOBase):
+        yield path_or_buf
+    elif mode == "w":
+        yield codecs.getwriter("utf-8")(path_or_buf)
+    else:
+        yield codecs.getreader("utf-8")(path_or_buf)
+
+
+class JsonStream:
+    """Incremental JSON parser of a text stream.
+
+    The JSON values are decoded one by one with `json.JSONDecoder.raw_decode`,
+    the buffer contains only the text of the current value.
+
+    *Attributes :*
+
+    - **stream** : text stream (with a `read` method)
+    - **buffer_size** : integer - number of characters read at once
+    - **buf** : string - text read and not yet parsed (from pos)
+    - **pos** : integer - position of the parser in buf
+    - **eof** : boolean - True if the stream is completely read
+    """
+
+    def __init__(self, stream, buffer_size=2**20):
+        """JsonStream constructor.
+
+        *Parameters*
+
+        - **stream** : text stream (with a `read` method)
+        - **buffer_size** : integer (default 2**20) - number of characters read at once
+        """
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _read(self, size):
+        """add 'size' characters to the buffer (False if the stream is read)"""
+        text = self.stream.read(size)
+        if not text:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos :] + text
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """return the next non-whitespace character ('' at the end of the stream)"""
+        while True:
+            self.pos = WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._read(self.buffer_size):
+                return ""
+
+    def expect(self, chars):
+        """consume and return the next non-whitespace character if it is in chars"""
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(
+                "Expecting one of " + repr(chars), self.buf, self.pos
+            )
+        self.pos += 1
+        return char
+
+    def value(self):
+        """decode and return the next JSON value"""
+        self.peek()
+        size = self.buffer_size
+        while True:
+            try:
+                val, end = self._decoder.raw_decode(self.buf, self.pos)
+                # a number can continue in the next characters
+                if NUMBER_CHARS.match(self.buf, end).end() < len(self.buf) or self.eof:
+                    self.pos = end
+                    return val
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            # the read size grows with the value to keep a linear parsing time
+            size = max(size, len(self.buf) - self.pos)
+            self._read(size)
+
+    def fields(self):
+        """generate the JSON value of each field of a NTV tab (object or array)"""
+        close = "}" if self.expect("{[") == "{" else "]"
+        if self.peek() == close:
+            self.pos += 1
+            return
+        while True:
+            if close == "}":
+                name = self.value()
+                self.expect(":")
+                yield {name: self.value()}
+            else:
+                yield self.value()
+            if self.expect("," + close) == close:
+                return
+
+    def records(self, chunksize):
+        """generate the records of a JSON array by list of 'chunksize' records"""
+        self.expect("[")
+        batch = []
+        if self.peek() == "]":
+            self.pos += 1
+        else:
+            while True:
+                batch.append(self.value())
+                if len(batch) == chunksize:
+                    yield batch
+                    batch = []
+                if self.expect(",]") == "]":
+                    break
+        if batch:
+            yield batch
@@ -38,4 +38,5 @@ setup(
         "pandas",
         "shapely",
     ],
+    extras_require={"cbor": ["cbor2"], "orjson": ["orjson"]},
 )
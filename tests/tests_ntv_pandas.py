@@ -10,14 +10,25 @@ The `NTV.test_ntv` module contains the unit tests (class unittest) for the
 
 import unittest
 import datetime
+import json
 from datetime import date
+from io import StringIO, BytesIO
 import csv
+import warnings
+import os
+import tempfile
 
+import numpy as np
 import pandas as pd
 import ntv_pandas as npd
-from shapely.geometry import Point, Polygon, LineString
+from ntv_pandas.pandas_ntv_connector import PdUtil
+from ntv_pandas import pandas_ntv_connector as connector
+from shapely.geometry import Point, Polygon, LineString, MultiPoint
+from tab_analysis import AnaDataset
 
 from json_ntv import Ntv, from_csv, to_csv
+from json_ntv.ntv_util import NtvError
+from json_ntv.ntv_connector import ShapelyConnec
 
 
 class TestNtvTabular(unittest.TestCase):
@@ -252,6 +263,519 @@ class TestNTVpandas(unittest.TestCase):
             self.assertEqual(Ntv.obj(ntv.to_obj(format="obj")), ntv)
             self.assertEqual(npd.to_json(npd.read_json(ntv)), ntv.to_obj())
 
+    def test_from_values(self):
+        """test the direct decoding path against pd.read_json"""
+        for data, dtype, ntv_type in [
+            ([1, 2, 3], None, ""),
+            ([1.5, None], None, ""),
+            ([True, False], None, ""),
+            ([1, None], "int32", "int32"),
+            ([1.0, 2.5], "float32", "float32"),
+            ([10, 20], "uint64", "uint64"),
+            ([True, False], "bool", "boolean"),
+            (["a", None, "1"], "string", "string"),
+            (["2021-12-31T23:00:00.000", None], "datetime64[ns]", "datetime"),
+            (["2021-12-31T23:00:00.000Z"], "datetime64[ns]", "datetime"),
+            (["P1DT0H0M0S", "P2DT0H0M0.5S"], "timedelta64[ns]", "duration"),
+        ]:
+            self.assertIsNotNone(npd.SeriesConnec._from_values(data, dtype))
+            srs = pd.read_json(StringIO(json.dumps(data)), dtype=dtype, typ="series")
+            pd.testing.assert_series_equal(
+                npd.SeriesConnec._from_json(data, dtype, ntv_type),
+                PdUtil.convert(ntv_type, srs, tojson=False),
+            )
+        for data, dtype in [([1.0, 2.0], None), ([True, None], "bool"), ([], None)]:
+            self.assertIsNone(npd.SeriesConnec._from_values(data, dtype))
+
+    def test_json_val(self):
+        """test the direct encoding path against Series.to_json"""
+        for srs in [
+            pd.Series([1, 2, 3], dtype="Int64"),
+            pd.Series([1, None, 3], dtype="Int32"),
+            pd.Series([10, 20], dtype="UInt64"),
+            pd.Series([True, None], dtype="boolean"),
+            pd.Series([1.5, None, 3], dtype="Float64"),
+            pd.Series([0.5, float("nan"), float("inf")]),
+            pd.Series(pd.to_datetime(["2022-01-01 10:00:00.123456", None])),
+            pd.Series(pd.to_datetime(["1900-01-01 00:00:00.5"]).tz_localize("CET")),
+        ]:
+            self.assertEqual(
+                PdUtil.json_val(srs),
+                json.loads(srs.to_json(orient="records", date_format="iso")),
+            )
+        srs = pd.Series([0.123456789012345, 1e-12])
+        self.assertEqual(PdUtil.json_val(srs), srs.to_list())
+        self.assertTrue(srs.equals(npd.read_json(npd.to_json(srs))))
+        for dtype in ["float32", "Float32"]:
+            srs = pd.Series([0.1, None, 1 / 3], dtype=dtype)
+            self.assertEqual(PdUtil.json_val(srs), [0.1, None, 0.33333334])
+        srs = pd.Series([0.1, 1 / 3], dtype="float32")
+        self.assertTrue(srs.equals(npd.read_json(npd.to_json(srs))))
+        self.assertIsNone(PdUtil.json_val(pd.Series(["a", "b"], dtype="string")))
+
+    def test_to_json_workers(self):
+        """test the concurrent encoding of the DataFrame columns"""
+        df = pd.DataFrame(
+            {
+                "value": [10, 20, 30],
+                "unic": [1, 1, 1],
+                "names::string": ["john", "eric", "judith"],
+                "group": pd.Series(list("aab")).astype("category"),
+            }
+        )
+        for data in [df, df[["value"]]]:
+            jsn = npd.to_json(data)
+            for executor in ["thread", "process"]:
+                self.assertEqual(npd.to_json(data, workers=2, executor=executor), jsn)
+        self.assertEqual(
+            df.npd.to_json(index=False, workers=3), npd.to_json(df, index=False)
+        )
+
+    def test_read_json_workers(self):
+        """test the concurrent decoding of the DataFrame Series"""
+        df = pd.DataFrame(
+            {
+                "value": [10, 20, 30],
+                "unic": [1, 1, 1],
+                "names::string": ["john", "eric", "judith"],
+                "group": pd.Series(list("aab")).astype("category"),
+                "dates::datetime": pd.to_datetime(["2021-01-01"] * 3),
+            }
+        )
+        jsn = npd.to_json(df)
+        for executor in ["thread", "process"]:
+            pd.testing.assert_frame_equal(
+                npd.read_json(jsn, workers=2, executor=executor), npd.read_json(jsn)
+            )
+
+    def test_read_json_lazy(self):
+        """test the LazyFrame (Series generated on first access)"""
+        tab = {
+            ":tab": {
+                "a": [[10, 20, 30], [0, 1, 2, 0, 1, 2, 0, 1]],
+                "b": [["x", "y"], 0, [0, 1, 1]],
+                "c": [["u", "v"], 3],
+                "g": [["k", "l"], 1, [1, 0]],
+                "d": [1, 2, 3, 4, 5, 6, 7, 8],
+                "e": [[1, 2], [4]],
+                "f": 3,
+            }
+        }
+        df = pd.DataFrame(
+            {"value": [10, 20, 30], "dates::datetime": ["2021-01-01"] * 3}
+        )
+        for jsn in [
+            tab,
+            json.dumps(tab),
+            npd.to_json(df),
+            npd.to_json(df, format="cbor"),
+        ]:
+            full = npd.read_json(jsn)
+            lazy = npd.read_json(jsn, lazy=True)
+            pd.testing.assert_frame_equal(lazy.to_pandas(), full)
+            for col in full.columns:
+                pd.testing.assert_series_equal(
+                    npd.read_json(jsn, lazy=True)[col], full[col], check_index=False
+                )
+        lazy = npd.read_json(tab, lazy=True)
+        self.assertEqual(len(lazy), 8)
+        self.assertEqual(list(lazy["c"]), ["v", "u", "u", "v", "u", "u", "v", "u"])
+        self.assertEqual(lazy.decoded, ["c"])
+        self.assertEqual(
+            [ind for ind, idx in enumerate(lazy.lidx) if idx], [0, 1, 2, 3]
+        )
+        pd.testing.assert_frame_equal(lazy[["d", "c"]], npd.read_json(tab)[["d", "c"]])
+        with self.assertRaises(NtvError):
+            npd.read_json({":field": {"a": [1, 2]}}, lazy=True)
+        with self.assertRaises(NtvError):
+            npd.read_json(
+                npd.to_json(pd.DataFrame({"a": [1, 2]}), table=True), lazy=True
+            )
+
+    def test_read_json_select(self):
+        """test the columns and rows selection (NTV tab and TableSchema)"""
+        df = pd.DataFrame(
+            {
+                "value": [10, 20, 30, 40, 50],
+                "unic": [1, 1, 1, 1, 1],
+                "names::string": ["john", "eric", "judith", "anna", "paul"],
+                "group": pd.Categorical(list("aabba")),
+                "dates::datetime": pd.to_datetime(["2021-01-01"] * 5),
+            },
+            index=[1, 2, 3, 4, 5],
+        )
+        for jsn in [npd.to_json(df), npd.to_json(df, optimize=True)]:
+            full = npd.read_json(jsn)
+            for rows in [slice(1, 4), slice(None, None, -2), slice(4, 5), slice(2, 2)]:
+                for columns in [["group"], ["names", "dates"], None]:
+                    dfr = full if columns is None else full[columns]
+                    pd.testing.assert_frame_equal(
+                        npd.read_json(jsn, columns=columns, rows=rows), dfr[rows]
+                    )
+            pd.testing.assert_frame_equal(npd.read_json(jsn, nrows=2), full[:2])
+        table = npd.to_json(df.drop(columns="group"), table=True)
+        dfr = npd.read_json(table)
+        pd.testing.assert_frame_equal(
+            npd.read_json(table, columns=["value"], rows=slice(1, 3)),
+            dfr[["value"]][1:3],
+        )
+        with self.assertRaises(NtvError):
+            npd.read_json(table, rows=slice(1, 3), nrows=2)
+        for jsn in [table, npd.to_json(df)]:
+            with self.assertRaises(NtvError):
+                npd.read_json(jsn, columns=["value", "zz"])
+            # the columns are in the requested order
+            self.assertEqual(
+                list(npd.read_json(jsn, columns=["unic", "value"]).columns),
+                ["unic", "value"],
+            )
+
+    def test_codec_cache(self):
+        """test the cache of the decoded codecs"""
+        dates = pd.to_datetime(["2021-01-01", "2022-01-01"])
+        df = pd.DataFrame(
+            {
+                "a": pd.Categorical(list("xyxx")),
+                "b": pd.Categorical(list("yyxy")),
+                "c": pd.Categorical(dates[[0, 1, 1, 0]]),
+                "d": pd.Categorical(dates[[1, 1, 1, 0]]),
+            }
+        )
+        jsn = npd.to_json(df)
+        try:
+            npd.set_codec_cache(0)
+            dfr = npd.read_json(jsn)
+            npd.set_codec_cache()
+            npd.codec_cache_clear()
+            for _ in range(2):
+                pd.testing.assert_frame_equal(npd.read_json(jsn), dfr)
+            info = npd.codec_cache_info()
+            self.assertEqual((info["hits"], info["misses"], info["entries"]), (6, 2, 2))
+            npd.set_codec_cache(info["size"] - 1)
+            self.assertEqual((npd.codec_cache_info()["entries"]), 1)
+            # the size of an entry is the size in bytes of the JSON codec
+            jsn = npd.to_json(pd.DataFrame({"a": pd.Categorical(["x" * 200, "y"] * 2)}))
+            for maxsize, entries in [(100, 0), (1000, 1)]:
+                npd.set_codec_cache(maxsize)
+                npd.codec_cache_clear()
+                npd.read_json(jsn)
+                self.assertEqual(npd.codec_cache_info()["entries"], entries)
+        finally:
+            npd.set_codec_cache()
+            npd.codec_cache_clear()
+
+    def test_to_idx_array(self):
+        """test to_idx and to_listidx with as_array"""
+        srs = pd.Series(["b", "a", None, "b"], name="x").astype("category")
+        idx = npd.SeriesConnec.to_idx(srs, as_array=True)
+        self.assertIs(idx["codec"], srs.cat.categories)
+        self.assertEqual(idx["keys"].dtype.name, "int8")
+        self.assertEqual(idx["keys"].tolist(), npd.SeriesConnec.to_idx(srs)["keys"])
+        self.assertEqual(list(idx["codec"]), npd.SeriesConnec.to_idx(srs)["codec"])
+        df = pd.DataFrame({"x": [1, 2, 1], "y": pd.to_datetime(["2021-01-01"] * 3)})
+        lidx, leng = npd.DataFrameConnec.to_listidx(df, as_array=True)
+        self.assertEqual(leng, 3)
+        self.assertEqual(
+            [idx["keys"].tolist() for idx in lidx],
+            [idx["keys"] for idx in npd.DataFrameConnec.to_listidx(df)[0]],
+        )
+
+    def test_categorical_json(self):
+        """test the JSON value of categorical Series"""
+        for codes, coef in [
+            ([0], 0),
+            ([0, 0, 1, 1], 2),
+            ([0, 1, 0, 1], 1),
+            ([1, 0], 0),
+            ([0, 1, 2, 0, 1], 0),
+            ([-1, -1], 0),
+        ]:
+            self.assertEqual(PdUtil.encode_coef(np.array(codes, dtype="int8")), coef)
+        srs = pd.Series(["a", "a", "b", "b"] * 2, name="x").astype("category")
+        self.assertEqual(npd.to_json(srs), {":field": {"x": [["a", "b"], [2]]}})
+        srs = pd.Series(["b", None, "b"], name="y").astype("category")
+        self.assertEqual(npd.to_json(srs), {":field": {"y": [["b"], [0, -1, 0]]}})
+        df = pd.DataFrame({"x": list("abab"), "z": list("aabb")}).astype("category")
+        self.assertEqual(npd.to_json(df, index=False)[":tab"]["z"], [["a", "b"], [2]])
+        self.assertTrue(npd.read_json(npd.to_json(df)).astype("category").equals(df))
+
+    def test_to_json_optimize(self):
+        """test to_json with optimize"""
+        df = pd.DataFrame(
+            {
+                "city": ["paris", "lyon", "paris", "paris", "lyon", "paris"],
+                "year": [2020, 2020, 2020, 2021, 2021, 2021],
+                "value": [10, 20, 30, 40, 50, 60],
+                "list": [[1], [2], [1], [2], [1], [2]],
+            }
+        )
+        jsn = npd.to_json(df, optimize=True)[":tab"]
+        self.assertEqual(jsn["city"], [["paris", "lyon"], [0, 1, 0, 0, 1, 0]])
+        self.assertEqual(jsn["year"], [[2020, 2021], [3]])
+        self.assertEqual(jsn["value"], [10, 20, 30, 40, 50, 60])
+        self.assertEqual(jsn["list"], npd.to_json(df)[":tab"]["list"])
+        df2 = npd.read_json(npd.to_json(df, optimize=True))
+        self.assertTrue(df2.astype(df.dtypes.to_dict()).equals(df))
+        srs = pd.Series([1, 2, 1, 2], name="x")
+        self.assertEqual(npd.to_json(srs, optimize=True), npd.to_json(srs))
+        srs = pd.Series(["paris", "lyon", "paris", "paris", "lyon", "paris"], name="x")
+        jsn = npd.to_json(srs, optimize=True)
+        self.assertEqual(jsn[":field"]["x"], [["paris", "lyon"], [0, 1, 0, 0, 1, 0]])
+        self.assertEqual(list(npd.read_json(jsn)), list(srs))
+        periodic = {"a": ["x", "y"] * 6, "b": ["p", "q", "r"] * 4}
+        for data in [periodic, {"a": periodic["a"]}]:
+            df = pd.DataFrame(data)
+            jsn = npd.to_json(df, optimize=True, index=False)
+            pd.testing.assert_frame_equal(npd.read_json(jsn), df)
+            buf = StringIO()
+            npd.to_json_file(df, buf, optimize=True, index=False)
+            pd.testing.assert_frame_equal(
+                npd.read_json_file(StringIO(buf.getvalue())), df
+            )
+
+    def test_to_json_cbor(self):
+        """test to_json and read_json with the 'cbor' format"""
+        df = pd.DataFrame(
+            {
+                "i8": np.array([1, 2, 3, 4], dtype="int8"),
+                "u32": np.array([1, 2, 3, 4], dtype="uint32"),
+                "f64": [1.0, 2.0, np.nan, 4.5],
+                "year::year": [2020, 2021, 2022, 2023],
+                "city": ["paris", "lyon", "paris", "nice"],
+                "const": [1, 1, 1, 1],
+                "cat": pd.Series(list("aabb")).astype("category"),
+            }
+        )
+        jsn = npd.to_json(df, format="cbor")[":tab"]
+        self.assertEqual(jsn["f64"].dtype, np.dtype("float64"))
+        self.assertEqual(jsn["i8::int8"].tolist(), [1, 2, 3, 4])
+        self.assertEqual(jsn["city"], ["paris", "lyon", "paris", "nice"])
+        data = npd.to_json(df, format="cbor", encoded=True)
+        self.assertIsInstance(data, bytes)
+        self.assertTrue(npd.read_json(data).equals(df))
+        self.assertTrue(npd.read_json(npd.to_json(df, format="cbor")).equals(df))
+        for srs in [df["u32"], df["city"], pd.Series([1.5, 2.5])]:
+            data = npd.to_json(srs, format="cbor", encoded=True)
+            self.assertTrue(npd.read_json(data).equals(npd.read_json(npd.to_json(srs))))
+        # numpy array field before a coupled field (parent = position in the tab)
+        tab = {
+            "f": [0.5, 1.5, 2.5, 3.5],
+            "a": [["x", "y"], [0, 1, 0, 1]],
+            "b": [["u", "v"], 1],
+        }
+        dfr = npd.read_json({":tab": tab})
+        tab = {":tab": tab | {"f": np.array(tab["f"])}}
+        for jsn in [tab, PdUtil.to_cbor(tab)]:
+            self.assertTrue(npd.read_json(jsn).equals(dfr))
+        with self.assertRaises(NtvError):
+            npd.to_json(df, format="xml")
+
+    def test_json_backend(self):
+        """test set_json_backend"""
+        df = pd.DataFrame({"value": [10, 20], "dates": pd.to_datetime(["2021"] * 2)})
+        self.assertEqual(npd.get_json_backend(), "json")
+        text = npd.to_json(df, encoded=True)
+        self.assertEqual(json.loads(text), npd.to_json(df))
+        with self.assertRaises(NtvError):
+            npd.set_json_backend("xml")
+        try:
+            npd.set_json_backend("orjson")
+        except NtvError:
+            return
+        try:
+            self.assertEqual(npd.get_json_backend(), "orjson")
+            self.assertEqual(
+                json.loads(npd.to_json(df, encoded=True)), json.loads(text)
+            )
+            self.assertTrue(npd.read_json(npd.to_json(df, encoded=True)).equals(df))
+            table = npd.to_json(df, encoded=True, table=True)
+            self.assertTrue(npd.read_json(table).equals(df))
+        finally:
+            npd.set_json_backend()
+
+    def test_unic(self):
+        """test PdUtil.unic and PdUtil.is_constant"""
+        for values, dtype, constant in [
+            ([1] * 200, "int64", True),
+            ([1] * 199 + [2], "int64", False),
+            ([None, None], "float64", True),
+            ([None, 1.0], "float64", False),
+            (["a", None, "a"], "string", False),
+            (["a"] * 3, "string", True),
+            ([None] * 3, "Int64", True),
+            ([[1, 2]] * 3, "object", False),
+            ([], "float64", False),
+        ]:
+            srs = pd.Series(values, dtype=dtype)
+            self.assertEqual(PdUtil.is_constant(srs), constant)
+            self.assertEqual(len(PdUtil.unic(srs)), 1 if constant else len(srs))
+        df = pd.DataFrame({"x": [1, 1, 1], "y": ["a", None, "a"]})
+        df["y"] = df["y"].astype("string")
+        self.assertEqual(npd.to_json(df, index=False)[":tab"]["x"], 1)
+        self.assertTrue(npd.read_json(npd.to_json(df)).equals(df))
+
+    def test_check_relation(self):
+        """test check_relation and check_relations"""
+        df = pd.DataFrame(
+            {
+                "city": ["paris", "lyon", "paris", "nice", "lyon", "paris"],
+                "zip": [75, 69, 75, 6, 68, 75],
+                "country": ["fr", "fr", "fr", "fr", "fr", "fr"],
+            }
+        )
+        self.assertEqual(
+            df.npd.check_relation("city", "zip", "derived"),
+            {"row": [1, 4], "zip": [69, 68], "city": ["lyon", "lyon"]},
+        )
+        self.assertEqual(df.npd.check_relation("zip", "city", "derived", False), ())
+        self.assertEqual(
+            df.npd.check_relation("city", "country", "coupled", False),
+            (0, 1, 2, 3, 4, 5),
+        )
+        self.assertEqual(
+            df.npd.check_relations(
+                [("city", "zip", "derived"), ("zip", "city", "coupled")], False
+            ),
+            [(1, 4), (1, 4)],
+        )
+
+    def test_to_analysis(self):
+        """test the relations computed by to_analysis"""
+        df = pd.DataFrame({"x": [1, 1, 2, 2], "y": [1, 2, 1, None], "z": list("abcd")})
+        ana = npd.to_analysis(df, distr=True)
+        self.assertEqual([fld["lencodec"] for fld in ana["fields"]], [2, 3, 4])
+        self.assertEqual(
+            ana["relations"],
+            {"x": {"y": [4, True], "z": [4, False]}, "y": {"z": [4, False]}},
+        )
+        ana = npd.to_analysis(df)
+        self.assertEqual(ana["relations"], {"x": {"y": 4, "z": 4}, "y": {"z": 4}})
+        self.assertEqual(
+            npd.to_analysis(df.iloc[:0])["relations"]["x"], {"y": 0, "z": 0}
+        )
+
+    def test_to_analysis_approx(self):
+        """test the approximate relations computed by to_analysis"""
+        leng = 200000
+        df = pd.DataFrame(
+            {
+                "id": range(leng),
+                "a": [i // 2 for i in range(leng)],
+                "b": [i % 3 for i in range(leng)],
+                "c": [i // 2 + i % 2 * 7 for i in range(leng)],
+            }
+        )
+        exact = npd.to_analysis(df)
+        approx = npd.to_analysis(df, approx=True)
+        self.assertEqual(approx["fields"], exact["fields"])
+        self.assertEqual(approx["relations"]["id"], exact["relations"]["id"])
+        self.assertEqual(approx["relations"]["a"]["b"], exact["relations"]["a"]["b"])
+        self.assertAlmostEqual(
+            approx["relations"]["a"]["c"] / exact["relations"]["a"]["c"], 1, delta=0.05
+        )
+
+    def test_pd_analysis(self):
+        """test the incremental analysis"""
+        df = pd.DataFrame({"x": [1, 1, 2, 2], "y": [1, 2, 1, None], "z": list("abcd")})
+        for distr in [False, True]:
+            ana = npd.PdAnalysis(df, distr=distr)
+            self.assertEqual(ana.to_analysis(), npd.to_analysis(df, distr))
+            df2 = df.assign(y=[1, 1, 2, 2], w=[3, 3, 3, 4]).drop(columns="x")
+            self.assertEqual(ana.update(df2).to_analysis(), npd.to_analysis(df2, distr))
+            self.assertEqual(ana.nb_computed, 3 + 3)
+            ana.set_column("x", df["x"]).drop_column("z")
+            self.assertEqual(
+                ana.to_analysis(),
+                npd.to_analysis(df2.drop(columns="z").assign(x=df["x"]), distr),
+            )
+            ana = npd.PdAnalysis(df2, distr=distr, workers=2)
+            self.assertEqual(ana.to_analysis(), npd.to_analysis(df2, distr))
+        for _ in range(2):
+            self.assertEqual(
+                df.npd.analysis().to_dict(), AnaDataset(npd.to_analysis(df)).to_dict()
+            )
+
+    def test_to_temporal(self):
+        """test the conversion of the temporal values with format detection"""
+        srs = pd.Series(["2021-01-01T10:00:00", None, "2021-01-02T11:30:00"], name="dt")
+        self.assertEqual(PdUtil.temporal_format("datetime", srs), "%Y-%m-%dT%H:%M:%S")
+        self.assertTrue(
+            PdUtil.convert("datetime", srs, tojson=False).equals(pd.to_datetime(srs))
+        )
+        # the format is kept for the next Series (with the same name)
+        self.assertEqual(
+            connector.TEMPORAL_FORMATS[("datetime", "dt")], "%Y-%m-%dT%H:%M:%S"
+        )
+        # format not detected (parsed by pd.to_datetime)
+        srs = pd.Series(["Jan 1 2021", "Feb 2 2021"], name="dt")
+        self.assertIsNone(PdUtil.temporal_format("datetime", srs))
+        self.assertEqual(
+            PdUtil.convert("datetime", srs, tojson=False).tolist(),
+            pd.to_datetime(srs).tolist(),
+        )
+        self.assertNotIn(("datetime", "dt"), connector.TEMPORAL_FORMATS)
+        # mixed UTC offsets (object values)
+        values = ["2021-01-01T10:00:00+02:00", "2021-01-01T10:00:00+01:00"]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", FutureWarning)
+            srs = npd.read_json({":field": {"x::datetime": values}})
+        self.assertEqual(srs.tolist(), [pd.Timestamp(val) for val in values])
+        srs = pd.Series(["2021-01-01", "2022-03-04"])
+        self.assertEqual(
+            PdUtil.convert("date", srs, tojson=False).tolist(),
+            [date(2021, 1, 1), date(2022, 3, 4)],
+        )
+        srs = pd.Series(["10:21:01", None, "08:01:02.5", "12:30"])
+        self.assertEqual(
+            PdUtil.convert("time", srs, tojson=False).tolist()[2:],
+            [datetime.time(8, 1, 2, 500000), datetime.time(12, 30)],
+        )
+        self.assertTrue(pd.isna(PdUtil.convert("time", srs, tojson=False)[1]))
+
+    def test_geo_convert(self):
+        """test the vectorized conversion of the geometries"""
+        poly = Polygon(
+            [[1.0, 2.0], [1.0, 30.0], [30.0, 30.0], [30, 2]],
+            [[[5.0, 16.0], [5.0, 27.0], [20.0, 27.0]]],
+        )
+        geoms = [
+            Point(1, 0),
+            LineString([[1.0, 2.0], [1.0, 3.0]]),
+            poly,
+            Point(1, 2, 3),
+            MultiPoint([(1, 2), (3, 4)]),
+            Point(),
+        ]
+        srs = pd.Series(geoms, index=range(10, 16), name="geo")
+        coords = PdUtil.convert("geometry", srs)
+        self.assertEqual(
+            coords.tolist(), [ShapelyConnec.to_coord(geo) for geo in geoms]
+        )
+        self.assertTrue(coords.index.equals(srs.index))
+        self.assertEqual(coords.name, "geo")
+        geojson = PdUtil.convert("geojson", srs)
+        self.assertEqual(
+            geojson.tolist(), [ShapelyConnec.to_geojson(geo) for geo in geoms]
+        )
+        self.assertTrue(PdUtil.convert("geojson", geojson, tojson=False).equals(srs))
+        # the coordinates of a MultiPoint are decoded as a LineString
+        self.assertTrue(
+            PdUtil.convert("geometry", coords[:4], tojson=False).equals(srs[:4])
+        )
+
+    def test_type_registry(self):
+        """test the dict lookups built from the configuration tables"""
+        sc = npd.SeriesConnec
+        for ntv_type, name_type, dtype in sc.types.values.tolist():
+            self.assertEqual(sc.types_ntv[ntv_type], (name_type, dtype))
+            if name_type is None and dtype:
+                self.assertEqual(sc.types_dtype[dtype], ntv_type)
+        for ntv_type, table_format, table_type in sc.table.values.tolist():
+            self.assertEqual(sc.table_ntv[ntv_type], (table_format, table_type))
+            self.assertEqual(sc.table_type[(table_type, table_format)], ntv_type)
+        for ntv_type, name_type, dtype in sc.typtab.values.tolist():
+            self.assertEqual(sc.typtab_dtype[dtype], ntv_type)
+
 
 class TestTablePandas(unittest.TestCase):
     """tests DataFrameConnec TableSchema"""
@@ -273,6 +797,153 @@ class TestTablePandas(unittest.TestCase):
             self.assertFalse(fields[rang]["type"] is None)
             self.assertTrue(df.equals(npd.read_json(npd.to_json(df, table=True))))
 
+    def test_table_json(self):
+        """tests the columnar TableSchema export"""
+        df = pd.DataFrame(
+            {
+                "i": [1, 2, 3, 4],
+                "f": [0.5, np.nan, np.inf, 1.25],
+                "s": ["a", None, "b", "c"],
+                "b": [True, False, True, True],
+                "dt": pd.to_datetime(["2021-01-01", None, "2021-01-03", "2021-01-04"]),
+                "td": pd.to_timedelta([1, 2, 3, 4], "s"),
+            },
+            index=pd.Index([10, 20, 30, 40], name="idx"),
+        )
+        pd_table = json.loads(df.to_json(orient="table", date_format="iso"))
+        table = npd.to_json(df, table=True)
+        self.assertEqual(table["data"], pd_table["data"])
+        self.assertEqual(table["schema"]["primaryKey"], ["idx"])
+        # non-finite floats are exported as null
+        df["f"] = df["f"].replace(np.inf, np.nan)
+        self.assertTrue(df.reset_index().equals(npd.read_json(table)))
+        srs = pd.Series([1.5, 2.5], name="val")
+        self.assertEqual(
+            npd.to_json(srs, table=True)["data"],
+            [{"index": 0, "val": 1.5}, {"index": 1, "val": 2.5}],
+        )
+        # floats are exported with full precision (float32 with its shortest repr)
+        values = np.random.default_rng(0).uniform(-1e9, 1e9, 1000).round(3)
+        srs = pd.Series(np.append(values, 123456789.123), name="f")
+        self.assertTrue(npd.read_json(npd.to_json(srs, table=True)).equals(srs))
+        srs = pd.Series([0.1, 2.5], name="val", dtype="float32")
+        self.assertEqual(npd.to_json(srs, table=True)["data"][0]["val"], 0.1)
+
+    def test_to_obj_table(self):
+        """tests the TableSchema import"""
+        df = pd.DataFrame(
+            {
+                "i": pd.Series([1, 2, 3], dtype="int32"),
+                "s": ["a", None, "b"],
+                "dt": pd.to_datetime(["2021-01-01", None, "2021-01-03"]),
+                "test::date": [date(2021, 1, 5), date(2021, 1, 6), date(2021, 1, 7)],
+                "p::point": [Point(1, 2), Point(3, 4), Point(5, 6)],
+            }
+        ).set_index(pd.date_range("2021-01-01", periods=3))
+        table = npd.to_json(df, table=True)
+        self.assertTrue(df.equals(npd.read_json(table)))
+        self.assertTrue(npd.read_json(table).index.equals(df.index))
+        # empty data
+        empty = npd.read_json({"schema": table["schema"], "data": []})
+        self.assertEqual(list(empty.columns), list(df.columns))
+        self.assertEqual(empty["i"].dtype, "int32")
+        # missing values in an integer column and missing field
+        table = {
+            "schema": {"fields": [{"name": "a", "type": "integer"}]},
+            "data": [{"a": 1}, {"a": None}, {}],
+        }
+        self.assertEqual(npd.read_json(table).tolist()[0], 1.0)
+        self.assertTrue(npd.read_json(table)[1:].isna().all())
+
+
+class TestFileStream(unittest.TestCase):
+    """tests pandas_ntv_stream"""
+
+    def test_read_json_file(self):
+        """test read_json_file with small buffers"""
+        df = pd.DataFrame(
+            {
+                "value": [10, 20, 30, 40],
+                "price": [1.5, 2.5, 10.25, 1.5],
+                "names::string": ["john", "eric", "judith", "anna"],
+                "group": pd.Series(list("aabb"), index=[1, 2, 3, 4]).astype("category"),
+                "dates::datetime": pd.to_datetime(["2021-01-01"] * 4),
+            },
+            index=[1, 2, 3, 4],
+        )
+        for jsn in [
+            npd.to_json(df),
+            npd.to_json(df.drop(columns="group"), table=True),
+            npd.to_json(df["value"]),
+            {":tab": {"p": [["u", "v"], [1, 0, 1]], "q": [["m", "n"], 0, [1, 0]]}},
+        ]:
+            text = json.dumps(jsn)
+            for src in [StringIO(text), BytesIO(text.encode())]:
+                dfr = npd.read_json_file(src, buffer_size=3, chunksize=3)
+                if isinstance(dfr, pd.DataFrame):
+                    pd.testing.assert_frame_equal(dfr, npd.read_json(text))
+                else:
+                    pd.testing.assert_series_equal(dfr, npd.read_json(text))
+        text = json.dumps(npd.to_json(df))
+        srs = npd.read_json_file(StringIO(text), iterator=True)
+        self.assertEqual([sr.name for sr in srs][1:], list(npd.read_json(text).columns))
+
+    def test_read_json_file_cache(self):
+        """test read_json_file with the cache (memory-mapped arrays)"""
+        df = pd.DataFrame(
+            {
+                "value": [10, 20, 30, 40],
+                "price": [1.5, 2.5, 10.25, 1.5],
+                "names::string": ["john", "eric", "judith", "anna"],
+                "group": pd.Categorical(list("aabb")),
+                "dates::datetime": pd.to_datetime(["2021-01-01"] * 4),
+                "coord::point": [Point(1, 2), Point(3, 4), Point(5, 6), Point(7, 8)],
+            },
+            index=[1, 2, 3, 4],
+        )
+        with tempfile.TemporaryDirectory() as folder:
+            path, cache = os.path.join(folder, "df.json"), os.path.join(folder, "cache")
+            npd.to_json_file(df, path)
+            dfr = npd.read_json_file(path)
+            for _ in range(2):
+                pd.testing.assert_frame_equal(
+                    npd.read_json_file(path, cache=cache), dfr
+                )
+            self.assertEqual(len(os.listdir(cache)), 1)
+            npd.to_json_file(df[["value", "price"]], path)
+            pd.testing.assert_frame_equal(
+                npd.read_json_file(path, cache=cache), npd.read_json_file(path)
+            )
+            self.assertEqual(len(os.listdir(cache)), 1)
+            with self.assertRaises(NtvError):
+                npd.read_json_file(StringIO(npd.to_json(df, encoded=True)), cache=cache)
+
+    def test_to_json_file(self):
+        """test to_json_file (same text as to_json)"""
+        df = pd.DataFrame(
+            {
+                "value": [10, 20, 30, 40],
+                "price": [1.5, 2.5, 10.25, 1.5],
+                "names::string": ["john", "eric", "judith", "anna"],
+                "unic": [1, 1, 1, 1],
+                "dates::datetime": pd.to_datetime(["2021-01-01"] * 4),
+            }
+        )
+        for data in [df, df["value"], df[["value"]], df[["unic"]]]:
+            for option in [
+                {},
+                {"index": False},
+                {"header": False},
+                {"table": True, "chunksize": 3},
+            ]:
+                text = npd.to_json(data, encoded=True, **option)
+                for buf in [StringIO(), BytesIO()]:
+                    npd.to_json_file(data, buf, **option)
+                    value = buf.getvalue()
+                    self.assertEqual(
+                        value if isinstance(value, str) else value.decode(), text
+                    )
+
 
 class TestExports(unittest.TestCase):
     """test exports Xarray, scipp"""